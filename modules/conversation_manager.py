@@ -18,6 +18,7 @@ from rich.console import Console
 from rich.live import Live
 from rich.prompt import Confirm
 
+from modules import json_utils
 from modules.config import CLIENT_CONFIG, CONVERSATIONS_FILE, SYSTEM_PROMPT, TOOL_CONFIG, UI_CONFIG
 from modules.renderer import render_json_response, render_plan, render_plan_step_result, render_plan_summary, render_diff
 from modules.tool_manager import ToolManager
@@ -689,7 +690,7 @@ ARGS: <valid JSON object>
                     if plan_result.get("success"):
                         console.print("[green]Plan execution successful. Getting final response...[/green]\n")
                         # Add plan results to conversation
-                        results_msg = f"Plan execution results:\n{json.dumps(plan_result, indent=2)}"
+                        results_msg = f"Plan execution results:\n{json_utils.dumps(plan_result, indent=True)}"
                         self.add_message(conv_id, "system", results_msg)
                         # Get final response from agent
                         return self.stream_response(conv_id, "Please provide your response based on the plan execution results.", retry_count=0)
@@ -726,7 +727,7 @@ ARGS: <valid JSON object>
                     if all_success:
                         console.print("[green]Tool execution successful. Getting final response...[/green]\n")
                         # Add tool results to conversation
-                        results_msg = f"Tool execution results:\n{json.dumps(all_results, indent=2)}"
+                        results_msg = f"Tool execution results:\n{json_utils.dumps(all_results, indent=True)}"
                         self.add_message(conv_id, "system", results_msg)
                         # Recursively call stream_response to get the final response
                         # The recursive call will handle its own rendering
@@ -734,7 +735,7 @@ ARGS: <valid JSON object>
                     else:
                         # Tool execution failed - check if we can retry
                         failed = [r for r in all_results if not r.get("success")]
-                        console.print(f"[red]Tool execution failed: {json.dumps(failed, indent=2)}[/red]\n")
+                        console.print(f"[red]Tool execution failed: {json_utils.dumps(failed, indent=True)}[/red]\n")
 
                         if retry_count < max_retries:
                             console.print(f"[yellow]Retry {retry_count + 1}/{max_retries}: Asking agent to reevaluate...[/yellow]\n")
@@ -759,7 +760,7 @@ ARGS: <valid JSON object>
                         else:
                             console.print(f"[red]Max retries ({max_retries}) reached. Tool execution permanently failed.[/red]\n")
                             # Add final failure to conversation
-                            failure_msg = f"Tool execution failed after {max_retries} retries:\n{json.dumps(failed, indent=2)}"
+                            failure_msg = f"Tool execution failed after {max_retries} retries:\n{json_utils.dumps(failed, indent=True)}"
                             self.add_message(conv_id, "system", failure_msg)
                             # Fall through to render the original response
 
@@ -0,0 +1,42 @@
+"""
+JSON Serialization Module
+
+This module serializes tool results for the conversation. Results can
+carry large strings (file contents, scraped pages, command output), so
+orjson is used when it is installed; it encodes such payloads several
+times faster than the standard library. Without orjson, json is used.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Non-ASCII characters are written as-is rather than as \\u escapes, with
+    either backend.
+
+    Args:
+        obj: The object to serialize
+        indent: Whether to indent the output by two spaces per level
+
+    Returns:
+        The JSON document as a string
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the standard library handles them
+
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
@@ -226,7 +226,140 @@ Phone: 555-1234
             print("✗ FAIL: Invalid regex not properly detected")
 
         print("\n" + "=" * 70)
-        print("TEST 9: Tool specification check")
+        print("TEST 9: Batch replacements in a single pass")
+        print("=" * 70)
+
+        with open(test_file_path, 'w') as f:
+            f.write("alpha\nbeta\ngamma\nbeta\n")
+
+        result = edit_tool.replace_text_batch(
+            file_path="test.txt",
+            edits=[
+                {"old_text": "alpha", "new_text": "ALPHA"},
+                {"old_text": "beta", "new_text": "BETA", "count": 0}
+            ]
+        )
+
+        print(f"\nSuccess: {result.get('success')}")
+        print(f"Edits applied: {result.get('edits_count')}")
+        print(f"\nDiff:\n{result.get('diff')}")
+
+        with open(test_file_path, 'r') as f:
+            content = f.read()
+
+        if content == "ALPHA\nBETA\ngamma\nBETA\n":
+            print("\n✓ PASS: All batched edits applied")
+        else:
+            print(f"\n✗ FAIL: Unexpected content after batch: {content!r}")
+
+        result = edit_tool.replace_text_batch(
+            file_path="test.txt",
+            edits=[
+                {"old_text": "ALPHA", "new_text": "alpha"},
+                {"old_text": "missing", "new_text": "x"}
+            ]
+        )
+
+        with open(test_file_path, 'r') as f:
+            content = f.read()
+
+        if not result.get('success') and content.startswith("ALPHA"):
+            print("✓ PASS: Batch with a missing old_text writes nothing")
+        else:
+            print("✗ FAIL: Failed batch modified the file")
+
+        print("\n" + "=" * 70)
+        print("TEST 10: Large-file replacement through links and non-UTF-8 data")
+        print("=" * 70)
+
+        # Files over 1 MiB edited without a diff take the memory-mapped path
+        filler = "x" * 80 + "\n"
+        large_content = "START\n" + filler * 15000
+
+        real_path = os.path.join(test_dir, "real.txt")
+        with open(real_path, 'w') as f:
+            f.write(large_content)
+        link_path = os.path.join(test_dir, "link.txt")
+        os.symlink("real.txt", link_path)
+
+        result = edit_tool.replace_text(
+            file_path="link.txt",
+            old_text="START",
+            new_text="BEGIN",
+            include_diff=False
+        )
+
+        with open(real_path, 'r') as f:
+            content = f.read()
+
+        if result.get('success') and os.path.islink(link_path) and content.startswith("BEGIN\n"):
+            print("✓ PASS: Edit through a symlink changes the target and keeps the link")
+        else:
+            print("✗ FAIL: Symlink replaced or target unchanged")
+
+        hard_path = os.path.join(test_dir, "hard.txt")
+        os.link(real_path, hard_path)
+
+        result = edit_tool.replace_text(
+            file_path="hard.txt",
+            old_text="BEGIN",
+            new_text="START",
+            include_diff=False
+        )
+
+        with open(real_path, 'r') as f:
+            content = f.read()
+
+        if result.get('success') and os.path.samefile(real_path, hard_path) and content.startswith("START\n"):
+            print("✓ PASS: Edit of a hard-linked file keeps the links together")
+        else:
+            print("✗ FAIL: Hard link split by the edit")
+
+        latin1_path = os.path.join(test_dir, "latin1.txt")
+        with open(latin1_path, 'wb') as f:
+            f.write(b"START caf\xe9\n" + filler.encode() * 15000)
+
+        result = edit_tool.replace_text(
+            file_path="latin1.txt",
+            old_text="START",
+            new_text="BEGIN",
+            include_diff=False
+        )
+
+        with open(latin1_path, 'rb') as f:
+            data = f.read()
+
+        if not result.get('success') and data.startswith(b"START"):
+            print("✓ PASS: Non-UTF-8 file rejected without being modified")
+        else:
+            print("✗ FAIL: Non-UTF-8 file was edited")
+
+        print("\n" + "=" * 70)
+        print("TEST 11: No-op dry runs keep the dry-run result shape")
+        print("=" * 70)
+
+        noop_results = [
+            edit_tool.replace_text(file_path="test.txt", old_text="gamma", new_text="gamma", dry_run=True),
+            edit_tool.replace_text_batch(
+                file_path="test.txt",
+                edits=[{"old_text": "gamma", "new_text": "delta"}, {"old_text": "delta", "new_text": "gamma"}],
+                dry_run=True
+            ),
+            edit_tool.regex_replace(file_path="test.txt", pattern=r"gam+a", replacement=r"\g<0>", dry_run=True)
+        ]
+        count_keys = ["changes_count", "edits_count", "replacements_count"]
+
+        for result, key in zip(noop_results, count_keys):
+            print(f"\n{result.get('message')} dry_run={result.get('dry_run')} {key}={result.get(key)}")
+
+        if all(result.get('success') and result.get('dry_run') is True and key in result
+               for result, key in zip(noop_results, count_keys)):
+            print("✓ PASS: No-op dry runs report dry_run and their change counts")
+        else:
+            print("✗ FAIL: No-op dry run results missing dry-run keys")
+
+        print("\n" + "=" * 70)
+        print("TEST 12: Tool specification check")
         print("=" * 70)
 
         spec = edit_tool.get_tool_spec()
@@ -238,10 +371,10 @@ Phone: 555-1234
         for method in spec['methods']:
             print(f"  - {method['name']}: {method['description']}")
 
-        if len(spec['methods']) == 2:
-            print("\n✓ PASS: Both replace_text and regex_replace methods in spec")
+        if len(spec['methods']) == 3:
+            print("\n✓ PASS: replace_text, replace_text_batch and regex_replace methods in spec")
         else:
-            print(f"\n✗ FAIL: Expected 2 methods, found {len(spec['methods'])}")
+            print(f"\n✗ FAIL: Expected 3 methods, found {len(spec['methods'])}")
 
         # Check dry_run parameter exists
         replace_text_params = spec['methods'][0]['parameters']
@@ -256,6 +389,7 @@ Phone: 555-1234
         print("\n✓ All enhanced features tested successfully!")
         print("✓ Dry-run mode prevents file modifications")
         print("✓ Diff output shows exact changes")
+        print("✓ Batched replacements applied in a single write")
         print("✓ Regex replacement with backreferences working")
         print("✓ Regex flags (IGNORECASE, MULTILINE, DOTALL) functional")
         print("✓ Error handling for invalid patterns")
@@ -0,0 +1,322 @@
+"""
+Test file_explorer tool listing, reading and searching, and file_manager
+create and move
+"""
+
+import sys
+import io
+import os
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.file_explorer import FileExplorerTool, MMAP_READ_THRESHOLD
+from tools.file_manager import FileManagerTool
+from pathlib import Path
+import tempfile
+import shutil
+
+def test_file_explorer():
+    """Test the file_explorer tool against a small directory tree."""
+
+    print("=" * 70)
+    print("FILE_EXPLORER TOOL TEST")
+    print("=" * 70)
+
+    # Create a temporary directory for testing
+    test_dir = tempfile.mkdtemp()
+    print(f"\nCreated test directory: {test_dir}")
+
+    try:
+        # Build the test tree
+        for rel_path in ["top.py", "notes.txt", "src/x.py", "src/a/y.py",
+                         "src/a/b/z.py", "src/a/b/.hid.py", "src/a/b/data.txt",
+                         "other/src/o.py"]:
+            full_path = os.path.join(test_dir, rel_path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, 'w') as f:
+                f.write(f"# {rel_path}\n")
+
+        # Initialize the tool
+        explorer = FileExplorerTool(base_path=test_dir)
+
+        print("\n" + "=" * 70)
+        print("TEST 1: search_files matches Path.rglob")
+        print("=" * 70)
+
+        for pattern in ["*.py", "src/*.py", "src/**/*.py", "**/*.py"]:
+            expected = sorted(str(p.relative_to(test_dir)) for p in Path(test_dir).rglob(pattern))
+            for max_workers in (1, 4):
+                result = explorer.search_files(pattern, max_workers=max_workers)
+                found = sorted(item['path'] for item in result.get('results', []))
+
+                if result.get('success') and found == expected:
+                    print(f"✓ PASS: {pattern!r} (max_workers={max_workers}) found {len(found)} files")
+                else:
+                    print(f"✗ FAIL: {pattern!r} (max_workers={max_workers}) found {found}, rglob found {expected}")
+
+        print("\n" + "=" * 70)
+        print("TEST 2: read_files keeps order and reports per-file errors")
+        print("=" * 70)
+
+        with open(os.path.join(test_dir, "big.txt"), 'w') as f:
+            f.write("x" * 2048)
+        with open(os.path.join(test_dir, "binary.bin"), 'wb') as f:
+            f.write(b"\xff\xfe\x00")
+
+        result = explorer.read_files(
+            ["src/x.py", "missing.py", "big.txt", "binary.bin", "src", "../outside.txt", "top.py"],
+            max_size=1024
+        )
+        files = result.get('files', [])
+
+        for item in files:
+            print(f"  success={item.get('success')} error={item.get('error')}")
+
+        expected_errors = [
+            None,
+            "File does not exist: missing.py",
+            "File too large",
+            "File is not a text file or uses unsupported encoding",
+            "Path is not a file: src",
+            "Access denied: Path is outside allowed directory",
+            None
+        ]
+        errors_match = len(files) == len(expected_errors) and all(
+            (item.get('error') is None) if expected is None else item.get('error', '').startswith(expected)
+            for item, expected in zip(files, expected_errors)
+        )
+
+        if (result.get('success') and errors_match
+                and files[0].get('content') == "# src/x.py\n" and files[6].get('content') == "# top.py\n"):
+            print("✓ PASS: Results in request order with the right per-file errors")
+        else:
+            print("✗ FAIL: Unexpected read_files results")
+
+        result = explorer.read_files("top.py")
+
+        print(f"\nString argument error: {result.get('error')}")
+
+        if not result.get('success') and 'files' not in result:
+            print("✓ PASS: Non-list file_paths rejected")
+        else:
+            print("✗ FAIL: Plain string read one character at a time")
+
+        print("\n" + "=" * 70)
+        print("TEST 3: Line counts with CR and CRLF line endings")
+        print("=" * 70)
+
+        for name, data in [("cr.txt", b"a\rb\rc\rd\r"), ("crlf.txt", b"a\r\nb\r\nc\r\nd")]:
+            with open(os.path.join(test_dir, name), 'wb') as f:
+                f.write(data)
+
+            partial = explorer.read_file(name, start_line=1, line_count=2)
+            whole = explorer.read_file(name)
+
+            print(f"\n{name}: partial total_lines={partial.get('total_lines')} "
+                  f"lines_read={partial.get('lines_read')}, whole total_lines={whole.get('total_lines')}")
+
+            if partial.get('total_lines') == 4 and partial.get('lines_read') == 2 and whole.get('total_lines') == 4:
+                print(f"✓ PASS: {name} counted as 4 lines by partial and whole reads")
+            else:
+                print(f"✗ FAIL: {name} line counts disagree")
+
+        print("\n" + "=" * 70)
+        print("TEST 4: list_directory listing, depth and truncation")
+        print("=" * 70)
+
+        for rel_path in ["listing/b.txt", "listing/a.txt", "listing/sub/c.txt", "listing/sub/deep/d.txt"]:
+            full_path = os.path.join(test_dir, rel_path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, 'w') as f:
+                f.write("12345")
+
+        result = explorer.list_directory("listing")
+        items = result.get('items', [])
+
+        print(f"\nItems: {[(item['name'], item['type'], item.get('size')) for item in items]}")
+
+        if (result.get('success') and result.get('path') == "listing"
+                and [item['name'] for item in items] == ["a.txt", "b.txt", "sub"]
+                and [item['type'] for item in items] == ["file", "file", "directory"]
+                and items[0].get('size') == 5 and items[2].get('size') is None
+                and "modified" in items[0] and not result.get('truncated')):
+            print("✓ PASS: Entries sorted by name with type, size and mtime")
+        else:
+            print("✗ FAIL: Unexpected non-recursive listing")
+
+        result = explorer.list_directory("listing", recursive=True, max_depth=2)
+        items = result.get('items', [])
+        listed = [(item['name'], item['depth']) for item in items]
+
+        print(f"Recursive items: {listed}")
+
+        if listed == [("a.txt", 0), ("b.txt", 0), ("sub", 0), ("c.txt", 1), ("deep", 1)]:
+            print("✓ PASS: Recursive listing is depth-first and stops at max_depth")
+        else:
+            print("✗ FAIL: Unexpected recursive listing")
+
+        result = explorer.list_directory("listing", recursive=True, max_depth=3, max_items=3)
+
+        if result.get('count') == 3 and result.get('truncated'):
+            print("✓ PASS: max_items truncates the listing and marks it truncated")
+        else:
+            print(f"✗ FAIL: Expected 3 truncated items, got {result.get('count')} (truncated={result.get('truncated')})")
+
+        result = explorer.list_directory("listing", recursive=True, max_depth=3, max_items=None)
+
+        if result.get('count') == 6 and not result.get('truncated'):
+            print("✓ PASS: max_items=None lists everything")
+        else:
+            print(f"✗ FAIL: Expected 6 items, got {result.get('count')}")
+
+        result = explorer.list_directory("listing", max_items=-1)
+
+        if not result.get('success'):
+            print("✓ PASS: Negative max_items rejected")
+        else:
+            print("✗ FAIL: Negative max_items accepted")
+
+        print("\n" + "=" * 70)
+        print("TEST 5: Minimal listings and iter_directory")
+        print("=" * 70)
+
+        result = explorer.list_directory("listing", recursive=True, max_depth=3, minimal=True)
+        paths = [item['path'] for item in result.get('items', [])]
+
+        print(f"\nMinimal paths: {paths}")
+
+        expected_paths = [os.path.join("listing", p) for p in
+                          ["a.txt", "b.txt", "sub", "sub/c.txt", "sub/deep", "sub/deep/d.txt"]]
+        if paths == expected_paths and all(set(item) == {"name", "path", "type", "depth"}
+                                           for item in result.get('items', [])):
+            print("✓ PASS: Minimal items carry base-relative paths and no stat data")
+        else:
+            print("✗ FAIL: Unexpected minimal listing")
+
+        iterated = list(explorer.iter_directory("listing", recursive=True, max_depth=3, minimal=True))
+
+        if iterated == result.get('items'):
+            print("✓ PASS: iter_directory yields the same items as list_directory")
+        else:
+            print("✗ FAIL: iter_directory differs from list_directory")
+
+        print("\n" + "=" * 70)
+        print("TEST 6: Line-range and whole-file reads")
+        print("=" * 70)
+
+        with open(os.path.join(test_dir, "lines.txt"), 'w') as f:
+            f.write("one\ntwo\nthree\nfour\nfive\n")
+
+        result = explorer.read_file("lines.txt", start_line=2, line_count=2)
+
+        print(f"\nRange content: {result.get('content')!r}")
+
+        if (result.get('content') == "two\nthree\n" and result.get('start_line') == 2
+                and result.get('end_line') == 3 and result.get('total_lines') == 5
+                and result.get('partial_read')):
+            print("✓ PASS: Line range read with the file's total line count")
+        else:
+            print("✗ FAIL: Unexpected line range result")
+
+        result = explorer.read_file("lines.txt", start_line=4)
+
+        if result.get('content') == "four\nfive\n" and result.get('total_lines') == 5:
+            print("✓ PASS: Range without line_count reads to the end")
+        else:
+            print("✗ FAIL: Range to end of file failed")
+
+        result = explorer.read_file("lines.txt", start_line=9)
+
+        if not result.get('success') and "exceeds file length (5 lines)" in result.get('error', ''):
+            print("✓ PASS: start_line past the end reported")
+        else:
+            print("✗ FAIL: start_line past the end not reported")
+
+        # Large enough to be decoded from a memory map
+        large_text = "line with ünïcödé\n" * (MMAP_READ_THRESHOLD // 10)
+        with open(os.path.join(test_dir, "src", "large.txt"), 'w', encoding='utf-8') as f:
+            f.write(large_text)
+
+        result = explorer.read_file("src/large.txt", max_size=4 * MMAP_READ_THRESHOLD)
+
+        if (result.get('content') == large_text and result.get('path') == os.path.join("src", "large.txt")
+                and result.get('total_lines') == MMAP_READ_THRESHOLD // 10):
+            print("✓ PASS: Large file read whole from a memory map")
+        else:
+            print("✗ FAIL: Large file content or metadata wrong")
+
+        result = explorer.search_files("y.py", search_path="src")
+        found = [item['path'] for item in result.get('results', [])]
+
+        if result.get('search_path') == "src" and found == [os.path.join("src", "a", "y.py")]:
+            print("✓ PASS: Search results relative to base_path")
+        else:
+            print(f"✗ FAIL: Unexpected search paths {found}")
+
+        print("\n" + "=" * 70)
+        print("TEST 7: file_manager create and move")
+        print("=" * 70)
+
+        manager = FileManagerTool(base_path=test_dir)
+
+        result = manager.create_file("made/new/file.txt", "hello")
+        with open(os.path.join(test_dir, "made", "new", "file.txt")) as f:
+            content = f.read()
+
+        if result.get('success') and content == "hello":
+            print("\n✓ PASS: File created with its parent directories")
+        else:
+            print("\n✗ FAIL: create_file failed")
+
+        result = manager.create_file("made/new/file.txt", "overwritten")
+        with open(os.path.join(test_dir, "made", "new", "file.txt")) as f:
+            content = f.read()
+
+        if not result.get('success') and "already exists" in result.get('error', '') and content == "hello":
+            print("✓ PASS: Existing file left untouched")
+        else:
+            print("✗ FAIL: create_file overwrote an existing file")
+
+        source = os.path.join(test_dir, "made", "new", "file.txt")
+        inode = os.stat(source).st_ino
+        result = manager.move("made/new/file.txt", "made/renamed.txt")
+        renamed = os.path.join(test_dir, "made", "renamed.txt")
+
+        if result.get('success') and not os.path.exists(source) and os.stat(renamed).st_ino == inode:
+            print("✓ PASS: File moved by rename")
+        else:
+            print("✗ FAIL: Rename move failed")
+
+        manager.create_file("made/other.txt", "other")
+        result = manager.move("made/other.txt", "made/renamed.txt")
+        with open(renamed) as f:
+            content = f.read()
+
+        if result.get('success') and content == "other":
+            print("✓ PASS: Move onto an existing file replaces it")
+        else:
+            print("✗ FAIL: Move onto an existing file failed")
+
+        result = manager.move("made/renamed.txt", "made/new")
+
+        if result.get('success') and os.path.isfile(os.path.join(test_dir, "made", "new", "renamed.txt")):
+            print("✓ PASS: Move into a directory keeps the file name")
+        else:
+            print("✗ FAIL: Move into a directory failed")
+
+        result = manager.move("made/missing.txt", "made/x.txt")
+
+        if not result.get('success') and "not found" in result.get('error', ''):
+            print("✓ PASS: Missing source reported")
+        else:
+            print("✗ FAIL: Missing source not reported")
+
+    finally:
+        # Cleanup
+        shutil.rmtree(test_dir)
+        print(f"\n🧹 Cleaned up test directory: {test_dir}")
+
+if __name__ == "__main__":
+    test_file_explorer()
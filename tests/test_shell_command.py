@@ -0,0 +1,170 @@
+"""
+Test shell_command tool timeouts, output handling and batches
+"""
+
+import sys
+import io
+import os
+import time
+import shutil
+import tempfile
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.shell_command import ShellCommandTool
+
+def test_shell_command():
+    """Test the shell_command tool's execute and execute_batch methods."""
+
+    print("=" * 70)
+    print("SHELL_COMMAND TOOL TEST")
+    print("=" * 70)
+
+    shell_tool = ShellCommandTool()
+
+    print("\n" + "=" * 70)
+    print("TEST 1: Simple command output")
+    print("=" * 70)
+
+    result = shell_tool.execute("echo hello")
+
+    print(f"\nSuccess: {result.get('success')}")
+    print(f"Stdout: {result.get('stdout')!r}")
+
+    if result.get('success') and result.get('stdout') == "hello\n" and result.get('returncode') == 0:
+        print("✓ PASS: Command output captured")
+    else:
+        print("✗ FAIL: Unexpected result")
+
+    print("\n" + "=" * 70)
+    print("TEST 2: Timeout with a background child holding the pipes")
+    print("=" * 70)
+
+    start = time.monotonic()
+    result = shell_tool.execute("sleep 8 &", timeout=2)
+    elapsed = time.monotonic() - start
+
+    print(f"\nSuccess: {result.get('success')}")
+    print(f"Error: {result.get('error')}")
+    print(f"Elapsed: {elapsed:.1f}s")
+
+    if not result.get('success') and result.get('error') == "Command timed out." and elapsed < 4:
+        print("✓ PASS: Timeout honoured after the command itself exited")
+    else:
+        print("✗ FAIL: Background child blocked the tool past its timeout")
+
+    print("\n" + "=" * 70)
+    print("TEST 3: Timeout of a long-running command")
+    print("=" * 70)
+
+    start = time.monotonic()
+    result = shell_tool.execute("sleep 5", timeout=1)
+    elapsed = time.monotonic() - start
+
+    print(f"\nError: {result.get('error')}")
+    print(f"Elapsed: {elapsed:.1f}s")
+
+    if result.get('error') == "Command timed out." and elapsed < 3:
+        print("✓ PASS: Long-running command killed at its timeout")
+    else:
+        print("✗ FAIL: Command not killed at its timeout")
+
+    print("\n" + "=" * 70)
+    print("TEST 4: Executable script without a #! line")
+    print("=" * 70)
+
+    script_dir = tempfile.mkdtemp()
+    try:
+        script_path = os.path.join(script_dir, "noshebang.sh")
+        with open(script_path, 'w') as f:
+            f.write("echo from script\n")
+        os.chmod(script_path, 0o755)
+
+        result = shell_tool.execute(script_path)
+
+        print(f"\nSuccess: {result.get('success')}")
+        print(f"Stdout: {result.get('stdout')!r}")
+
+        if result.get('success') and result.get('stdout') == "from script\n":
+            print("✓ PASS: Script run by the shell")
+        else:
+            print("✗ FAIL: Script without #! not run")
+    finally:
+        shutil.rmtree(script_dir)
+
+    print("\n" + "=" * 70)
+    print("TEST 5: Batch output split per command, state carried over")
+    print("=" * 70)
+
+    result = shell_tool.execute_batch(["cd /", "pwd", "echo out; echo err >&2"])
+    results = result.get('results', [])
+
+    print(f"\nSuccess: {result.get('success')}")
+    for item in results:
+        print(f"  {item['command']!r}: rc={item['returncode']} stdout={item['stdout']!r} stderr={item['stderr']!r}")
+
+    if (result.get('success') and len(results) == 3 and result.get('skipped') == 0
+            and results[1]['stdout'] == "/\n" and results[2]['stdout'] == "out\n"
+            and results[2]['stderr'] == "err\n" and all(item['returncode'] == 0 for item in results)):
+        print("✓ PASS: Each command's output and return code recorded")
+    else:
+        print("✗ FAIL: Batch output not split correctly")
+
+    print("\n" + "=" * 70)
+    print("TEST 6: Batch stops at a failing middle command")
+    print("=" * 70)
+
+    result = shell_tool.execute_batch(["echo one", "false", "echo three"])
+    results = result.get('results', [])
+
+    print(f"\nResults: {[(item['command'], item['returncode']) for item in results]}")
+    print(f"Skipped: {result.get('skipped')}")
+
+    if len(results) == 2 and results[1]['returncode'] == 1 and result.get('skipped') == 1:
+        print("✓ PASS: stop_on_error skipped the remaining command")
+    else:
+        print("✗ FAIL: stop_on_error not honoured")
+
+    result = shell_tool.execute_batch(["echo one", "false", "echo three"], stop_on_error=False)
+    results = result.get('results', [])
+
+    if (len(results) == 3 and results[1]['returncode'] == 1
+            and results[2]['stdout'] == "three\n" and result.get('skipped') == 0):
+        print("✓ PASS: Without stop_on_error all commands ran")
+    else:
+        print("✗ FAIL: Batch stopped despite stop_on_error=False")
+
+    print("\n" + "=" * 70)
+    print("TEST 7: Batch command that exits the shell")
+    print("=" * 70)
+
+    result = shell_tool.execute_batch(["echo before", "echo last; exit 3", "echo after"], stop_on_error=False)
+    results = result.get('results', [])
+
+    print(f"\nResults: {[(item['command'], item['returncode'], item['stdout']) for item in results]}")
+    print(f"Skipped: {result.get('skipped')}")
+
+    if (len(results) == 2 and results[1]['returncode'] == 3
+            and results[1]['stdout'] == "last\n" and result.get('skipped') == 1):
+        print("✓ PASS: exit N recorded with its output and status")
+    else:
+        print("✗ FAIL: exit N not handled")
+
+    print("\n" + "=" * 70)
+    print("TEST 8: Batch rejects a plain string")
+    print("=" * 70)
+
+    result = shell_tool.execute_batch("ls")
+
+    print(f"\nSuccess: {result.get('success')}")
+    print(f"Error: {result.get('error')}")
+
+    if not result.get('success') and 'results' not in result:
+        print("✓ PASS: Non-list commands rejected without running anything")
+    else:
+        print("✗ FAIL: Plain string was run")
+
+if __name__ == "__main__":
+    test_shell_command()
@@ -0,0 +1,90 @@
+"""
+HTML Text Extraction
+
+Turns a fetched web page into the plain text the web tools return.
+The fastest available parser is used: selectolax (a C HTML engine) when
+installed, otherwise BeautifulSoup with lxml, otherwise BeautifulSoup's
+pure Python html.parser. Plain text documents skip the parser entirely.
+"""
+
+from typing import Optional
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+if HTMLParser is None:
+    from bs4 import BeautifulSoup
+
+    try:
+        import lxml  # noqa: F401  (only checked for availability)
+        BS4_PARSER = "lxml"
+    except ImportError:
+        BS4_PARSER = "html.parser"
+
+# Elements whose content is never visible text
+SKIPPED_TAGS = ("script", "style", "noscript")
+
+
+def _charset(content_type: str) -> str:
+    """Return the charset named in a Content-Type header, defaulting to UTF-8."""
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset":
+            return value.strip().strip('"\'') or "utf-8"
+    return "utf-8"
+
+
+def extract_text(html: bytes, max_chars: Optional[int] = None,
+                 content_type: str = "") -> str:
+    """
+    Extract the visible text of an HTML (or plain text) document.
+
+    Args:
+        html: The raw page body; its encoding is detected by the parser.
+        max_chars: If given, stop cleaning up the text once this many
+                   characters have been produced, and truncate to it.
+        content_type: The response's Content-Type header. text/plain
+                      bodies are decoded directly instead of being parsed.
+
+    Returns:
+        The text content, one phrase per line, without blank lines.
+    """
+    if content_type.lower().startswith("text/plain"):
+        # The body already is the text; building a parse tree would only
+        # cost time (and could mangle text that happens to contain '<')
+        try:
+            text = html.decode(_charset(content_type), errors="replace")
+        except LookupError:
+            text = html.decode("utf-8", errors="replace")
+    elif HTMLParser is not None:
+        tree = HTMLParser(html)
+        for node in tree.css(",".join(SKIPPED_TAGS)):
+            node.decompose()
+        text = tree.root.text(separator="\n") if tree.root is not None else ""
+    else:
+        soup = BeautifulSoup(html, BS4_PARSER)
+        for node in soup(list(SKIPPED_TAGS)):
+            node.decompose()
+        text = soup.get_text()
+
+    if max_chars is None:
+        # Same cleanup as below, done with C-level string operations: a double
+        # space separates phrases just like a line break, and stripping each
+        # phrase also strips the whitespace around its line
+        return '\n'.join(filter(None, map(str.strip, text.replace("  ", "\n").splitlines())))
+
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    chunks = (chunk for chunk in chunks if chunk)
+
+    # The pipeline is lazy, so only the part of the text that is kept gets cleaned
+    kept = []
+    length = 0
+    for chunk in chunks:
+        kept.append(chunk)
+        length += len(chunk) + 1  # Including the newline joining it to the next chunk
+        if length > max_chars:
+            break
+    return '\n'.join(kept)[:max_chars]
@@ -0,0 +1,90 @@
+"""
+HTTP Session Helpers
+
+Shared setup for the tools that fetch web pages. All of them use the one
+process-wide SESSION, so connections (and TLS sessions) to a host are
+reused across requests, tools and agent turns instead of being
+re-established each time.
+"""
+
+from typing import Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connection pools kept per session, and connections kept per host
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# Page bodies are cut off after this many bytes
+MAX_BODY_BYTES = 2 * 1024 * 1024
+
+# Content types that are parsed for text; anything else is rejected
+TEXT_CONTENT_TYPES = ("text/", "application/xhtml")
+
+
+def create_session() -> requests.Session:
+    """
+    Create a session with pooled keep-alive connections.
+
+    Idempotent requests are retried twice, with a short backoff, on
+    connection errors and on 502/503/504 responses. When the retries run
+    out, the last response is returned so raise_for_status() reports it
+    as usual.
+    """
+    retries = Retry(
+        total=2,
+        backoff_factor=0.1,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retries
+    )
+
+    # No Accept-Encoding override: requests already advertises every
+    # encoding urllib3 can decode (gzip and deflate, plus br with Brotli
+    # installed and zstd with zstandard installed)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared by every web tool; requests sessions are safe to use from the
+# fetch threads as long as their configuration is not changed
+SESSION = create_session()
+
+
+def fetch_page(session: requests.Session, url: str, timeout: float,
+               max_bytes: int = MAX_BODY_BYTES) -> Tuple[bytes, str]:
+    """
+    Fetch a web page body, reading at most max_bytes of it.
+
+    The body is streamed so that large pages are neither fully downloaded
+    nor held in memory; only the first max_bytes are returned, together
+    with the response's Content-Type header (empty if the server sent none).
+
+    Raises:
+        requests.RequestException: If the request fails or returns an error status
+        ValueError: If the response is not an HTML or text document
+    """
+    with session.get(url, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+
+        # Decided from the headers alone: with stream=True none of the body has
+        # been downloaded yet, so rejected resources cost no more than a HEAD
+        content_type = response.headers.get("Content-Type", "")
+        if content_type and not content_type.lower().startswith(TEXT_CONTENT_TYPES):
+            raise ValueError(f"Unsupported content type: {content_type}")
+
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            body += chunk
+            if len(body) >= max_bytes:
+                del body[max_bytes:]
+                break
+        return bytes(body), content_type
@@ -0,0 +1,38 @@
+"""
+Tool Specification Helpers
+
+Tool specifications never change at runtime, so tools build them once at
+import time and hand out the same read-only object on every
+get_tool_spec() call.
+"""
+
+from types import MappingProxyType
+from typing import Any
+
+
+def freeze_spec(value: Any) -> Any:
+    """
+    Return a read-only copy of a tool specification.
+
+    Dicts become MappingProxyType views and lists become tuples, recursively,
+    so a shared spec cannot be modified by one of its consumers.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze_spec(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_spec(item) for item in value)
+    return value
+
+
+def thaw_spec(value: Any) -> Any:
+    """
+    Return a plain dict/list copy of (part of) a frozen specification.
+
+    Needed wherever a spec fragment is passed to json.dumps, which does not
+    accept MappingProxyType.
+    """
+    if isinstance(value, MappingProxyType):
+        return {key: thaw_spec(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_spec(item) for item in value]
+    return value
@@ -15,8 +15,10 @@ from rich.console import Console
 console = Console()
 
 # Import config to access OpenRouter API key loaded from .env
+from modules import json_utils
 from modules.config import OPENROUTER_CONFIG
 from modules.paths import get_agents_dir
+from tools._spec import thaw_spec
 
 
 class AgentsTool:
@@ -150,9 +152,9 @@ class AgentsTool:
                         "description": param_spec.get("description", "")
                     }
 
-                    # Handle array types
+                    # Handle array types (string items unless the spec says otherwise)
                     if param_spec.get("type") == "array":
-                        properties[param_name]["items"] = {"type": "string"}
+                        properties[param_name]["items"] = thaw_spec(param_spec.get("items", {"type": "string"}))
 
                     if param_spec.get("required", False):
                         required_params.append(param_name)
@@ -203,7 +205,7 @@ class AgentsTool:
             console.print(f"[dim]Agent executing: {tool_name}.{method_name}[/dim]")
             result = self.tool_manager.execute_tool_method(tool_name, method_name, **arguments)
 
-            return json.dumps(result)
+            return json_utils.dumps(result)
 
         except Exception as e:
             return json.dumps({"success": False, "error": f"Tool execution failed: {str(e)}"})
@@ -10,11 +10,300 @@ The tool provides:
 - Dry run mode with diff preview
 """
 
+import io
+import codecs
 import os
 import re
+import mmap
+import stat
+import shutil
 import difflib
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Mapping, Any, Iterator, List, Optional, Tuple
+
+from tools._spec import freeze_spec
+
+# Prefer the C implementation of SequenceMatcher when it is installed;
+# it is API compatible with difflib's pure Python matcher.
+try:
+    from cdifflib import CSequenceMatcher as _SequenceMatcher
+except ImportError:
+    _SequenceMatcher = difflib.SequenceMatcher
+
+# Number of context lines shown around each hunk
+DIFF_CONTEXT_LINES = 3
+
+# Block size (in characters) used when trimming identical leading/trailing content
+_COMPARE_BLOCK = 4096
+
+# Tool regex flags (1=IGNORECASE, 2=MULTILINE, 4=DOTALL) indexed by their sum
+_REGEX_FLAGS = tuple(
+    (re.IGNORECASE if bits & 1 else 0) |
+    (re.MULTILINE if bits & 2 else 0) |
+    (re.DOTALL if bits & 4 else 0)
+    for bits in range(8)
+)
+
+# Characters that give a regex pattern a meaning other than its literal text
+_REGEX_METACHARACTERS = re.compile(r'[.^$*+?{}\[\]\\|()]')
+
+# Compiled regex patterns are cached per thread, keyed by (pattern, flags)
+_PATTERN_CACHE_SIZE = 64
+_thread_state = threading.local()
+
+# Files larger than this are edited through a memory map when no diff is needed
+MMAP_THRESHOLD = 1 << 20
+
+# Bytes of a mapped file checked per step when validating it as UTF-8
+_VALIDATE_CHUNK = 1 << 20
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Convert a line range to unified diff "start,length" notation."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _unified_diff(a: List[str], b: List[str], fromfile: str, tofile: str,
+                  line_offset: int = 0) -> Iterator[str]:
+    """
+    Generate a unified diff, matching the output of difflib.unified_diff with lineterm=''.
+
+    Args:
+        a: Original lines
+        b: Modified lines
+        fromfile: Header name for the original file
+        tofile: Header name for the modified file
+        line_offset: Number of unchanged lines preceding a and b in the file,
+                     added to the hunk header line numbers
+
+    Yields:
+        Diff lines
+    """
+    started = False
+    for group in _SequenceMatcher(None, a, b).get_grouped_opcodes(DIFF_CONTEXT_LINES):
+        if not started:
+            started = True
+            yield f"--- {fromfile}"
+            yield f"+++ {tofile}"
+
+        first, last = group[0], group[-1]
+        old_range = _format_range(first[1] + line_offset, last[2] + line_offset)
+        new_range = _format_range(first[3] + line_offset, last[4] + line_offset)
+        yield f"@@ -{old_range} +{new_range} @@"
+
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                for line in a[i1:i2]:
+                    yield ' ' + line
+                continue
+            if tag in ('replace', 'delete'):
+                for line in a[i1:i2]:
+                    yield '-' + line
+            if tag in ('replace', 'insert'):
+                for line in b[j1:j2]:
+                    yield '+' + line
+
+
+def _compile_pattern(pattern: str, re_flags: int) -> "re.Pattern[str]":
+    """
+    Compile a regex pattern, reusing the calling thread's cached copy if present.
+
+    Each thread keeps its own cache, so lookups need no locking. When the
+    cache is full the oldest entry is evicted.
+
+    Args:
+        pattern: Regular expression pattern
+        re_flags: Flags from the re module
+
+    Returns:
+        The compiled pattern
+
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    cache = getattr(_thread_state, 'patterns', None)
+    if cache is None:
+        cache = _thread_state.patterns = {}
+
+    key = (pattern, re_flags)
+    compiled = cache.get(key)
+    if compiled is None:
+        compiled = re.compile(pattern, re_flags)
+        if len(cache) >= _PATTERN_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = compiled
+    return compiled
+
+
+def _write_all(fd: int, buffers: List[Any]) -> None:
+    """
+    Write all buffers to a file descriptor, using one vectored write where possible.
+
+    Args:
+        fd: Open file descriptor
+        buffers: Bytes-like objects to write in order
+    """
+    views = [memoryview(buf) for buf in buffers if len(buf)]
+
+    if not hasattr(os, 'writev'):
+        for view in views:
+            while view:
+                view = view[os.write(fd, view):]
+        return
+
+    # writev may write less than requested; resume from where it stopped
+    while views:
+        written = os.writev(fd, views)
+        while views and written >= views[0].nbytes:
+            written -= views[0].nbytes
+            views.pop(0)
+        if written:
+            views[0] = views[0][written:]
+
+
+_TOOL_SPEC = freeze_spec({
+    "tool_name": "EDIT_FILE",
+    "description": "A tool for editing files with text replacement, batched replacements and regex support. Supports dry-run mode to preview changes.",
+    "version": "2.0.0",
+    "methods": [
+        {
+            "name": "replace_text",
+            "description": "Replaces a specific string of text in a file. Supports dry-run mode to preview changes before applying them.",
+            "parameters": {
+                "file_path": {
+                    "type": "string",
+                    "description": "The relative path to the file to be edited.",
+                    "required": True
+                },
+                "old_text": {
+                    "type": "string",
+                    "description": "The exact block of text to be found and replaced. Must be an exact match.",
+                    "required": True
+                },
+                "new_text": {
+                    "type": "string",
+                    "description": "The new block of text that will replace the old_text.",
+                    "required": True
+                },
+                "count": {
+                    "type": "integer",
+                    "description": "The number of occurrences to replace. Set to 1 for the first match, or 0 to replace all matches.",
+                    "required": False,
+                    "default": 1
+                },
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "If True, preview changes with a diff without writing to the file. Use this to verify changes before applying them.",
+                    "required": False,
+                    "default": False
+                },
+                "include_diff": {
+                    "type": "boolean",
+                    "description": "If False, skip generating the diff when writing changes. Dry runs always include the diff.",
+                    "required": False,
+                    "default": True
+                }
+            },
+            "returns": "A dictionary with success status, diff, and message. In dry_run mode, includes the diff preview without modifying the file.",
+            "destruct_flag": True
+        },
+        {
+            "name": "replace_text_batch",
+            "description": "Applies several exact text replacements to one file in a single read and write. Edits are applied in order; if any old_text is not found, nothing is written. Supports dry-run mode.",
+            "parameters": {
+                "file_path": {
+                    "type": "string",
+                    "description": "The relative path to the file to be edited.",
+                    "required": True
+                },
+                "edits": {
+                    "type": "array",
+                    "description": "List of edits. Each edit is an object with 'old_text' (exact text to find), 'new_text' (replacement) and optional 'count' (occurrences to replace, default 1, 0 for all).",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "old_text": {"type": "string"},
+                            "new_text": {"type": "string"},
+                            "count": {"type": "integer"}
+                        },
+                        "required": ["old_text", "new_text"]
+                    },
+                    "required": True
+                },
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "If True, preview changes with a diff without writing to the file.",
+                    "required": False,
+                    "default": False
+                },
+                "include_diff": {
+                    "type": "boolean",
+                    "description": "If False, skip generating the diff when writing changes. Dry runs always include the diff.",
+                    "required": False,
+                    "default": True
+                }
+            },
+            "returns": "A dictionary with success status, a single diff covering all edits, and the number of edits applied.",
+            "destruct_flag": True
+        },
+        {
+            "name": "regex_replace",
+            "description": "Replace text in a file using regular expressions. Supports backreferences and advanced pattern matching. Supports dry-run mode.",
+            "parameters": {
+                "file_path": {
+                    "type": "string",
+                    "description": "The relative path to the file to be edited.",
+                    "required": True
+                },
+                "pattern": {
+                    "type": "string",
+                    "description": "Regular expression pattern to search for. Use standard Python regex syntax.",
+                    "required": True
+                },
+                "replacement": {
+                    "type": "string",
+                    "description": "Replacement string. Can include backreferences like \\1, \\2 for captured groups.",
+                    "required": True
+                },
+                "count": {
+                    "type": "integer",
+                    "description": "Maximum number of replacements to make. 0 means replace all matches.",
+                    "required": False,
+                    "default": 0
+                },
+                "flags": {
+                    "type": "integer",
+                    "description": "Regex flags: 0=none, 1=IGNORECASE, 2=MULTILINE, 4=DOTALL. Combine by adding (e.g., 3=IGNORECASE+MULTILINE).",
+                    "required": False,
+                    "default": 0
+                },
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "If True, preview changes with a diff without writing to the file.",
+                    "required": False,
+                    "default": False
+                },
+                "include_diff": {
+                    "type": "boolean",
+                    "description": "If False, skip generating the diff when writing changes. Dry runs always include the diff.",
+                    "required": False,
+                    "default": True
+                }
+            },
+            "returns": "A dictionary with success status, diff, matches found, and replacements count.",
+            "destruct_flag": True
+        }
+    ]
+})
+
 
 class EditFileTool:
     """
@@ -32,9 +321,13 @@ class EditFileTool:
             base_path: Optional base path to restrict access (default: current directory)
         """
         self.base_path = Path(base_path) if base_path else Path.cwd()
+        self._base_str = str(self.base_path)
+        self._base_resolved = os.path.realpath(self._base_str)
+        self._base_prefix = os.path.join(self._base_resolved, '')
         self.tool_name = "EDIT_FILE"
     
-    def _generate_diff(self, old_content: str, new_content: str, file_path: str) -> str:
+    def _generate_diff(self, old_content: str, new_content: str, file_path: str,
+                       change: Optional[Tuple[int, int, int]] = None) -> str:
         """
         Generate a unified diff between old and new content.
 
@@ -42,24 +335,116 @@ class EditFileTool:
             old_content: Original file content
             new_content: Modified file content
             file_path: Path to the file (for diff header)
+            change: Optional (start, old_end, new_end) character offsets of the
+                    region that differs. If omitted, it is found by skipping the
+                    identical start and end of both contents.
 
         Returns:
             Unified diff string
         """
-        old_lines = old_content.splitlines(keepends=True)
-        new_lines = new_content.splitlines(keepends=True)
+        # Stream the diff lines into one buffer instead of collecting them in a list first
+        buffer = io.StringIO()
+        buffer.writelines(self._generate_diff_iter(old_content, new_content, file_path, change))
+        return buffer.getvalue()
+
+    def _generate_diff_iter(self, old_content: str, new_content: str, file_path: str,
+                            change: Optional[Tuple[int, int, int]] = None) -> Iterator[str]:
+        """
+        Lazily generate the lines of a unified diff between old and new content.
 
-        diff = difflib.unified_diff(
-            old_lines,
-            new_lines,
+        Nothing is computed until the first line is requested, so callers that
+        stream or truncate the diff only pay for the part they consume.
+
+        Args:
+            old_content: Original file content
+            new_content: Modified file content
+            file_path: Path to the file (for diff header)
+            change: Optional (start, old_end, new_end) character offsets of the
+                    region that differs (see _generate_diff)
+
+        Yields:
+            Unified diff lines
+        """
+        # Only the lines around the changed region are split and compared
+        if change is None:
+            change = self._changed_region(old_content, new_content)
+        start, old_end, new_end = change
+        window_start, window_end = self._diff_window(old_content, start, old_end)
+        line_offset = old_content.count('\n', 0, window_start)
+        old_content = old_content[window_start:window_end]
+        new_content = new_content[window_start:window_end + (new_end - old_end)]
+
+        yield from _unified_diff(
+            old_content.splitlines(keepends=True),
+            new_content.splitlines(keepends=True),
             fromfile=f"a/{file_path}",
             tofile=f"b/{file_path}",
-            lineterm=''
+            line_offset=line_offset
         )
 
-        return ''.join(diff)
+    def _changed_region(self, old_content: str, new_content: str) -> Tuple[int, int, int]:
+        """
+        Find the region that differs between two contents.
+
+        Identical leading and trailing content is skipped in blocks of
+        _COMPARE_BLOCK characters, so the result may include a few unchanged
+        characters on either side.
+
+        Args:
+            old_content: Original file content
+            new_content: Modified file content
 
-    def replace_text(self, file_path: str, old_text: str, new_text: str, count: int = 1, dry_run: bool = False) -> Dict[str, Any]:
+        Returns:
+            (start, old_end, new_end) character offsets of the differing region
+        """
+        old_length = len(old_content)
+        new_length = len(new_content)
+        limit = min(old_length, new_length)
+
+        prefix = 0
+        while (prefix + _COMPARE_BLOCK <= limit and
+               old_content[prefix:prefix + _COMPARE_BLOCK] == new_content[prefix:prefix + _COMPARE_BLOCK]):
+            prefix += _COMPARE_BLOCK
+
+        limit -= prefix
+        suffix = 0
+        while (suffix + _COMPARE_BLOCK <= limit and
+               old_content[old_length - suffix - _COMPARE_BLOCK:old_length - suffix] ==
+               new_content[new_length - suffix - _COMPARE_BLOCK:new_length - suffix]):
+            suffix += _COMPARE_BLOCK
+
+        return prefix, old_length - suffix, new_length - suffix
+
+    def _diff_window(self, content: str, start: int, end: int) -> Tuple[int, int]:
+        """
+        Expand the character range [start, end) to whole lines plus diff context.
+
+        Args:
+            content: Original file content
+            start: Offset of the first changed character
+            end: Offset just past the last changed character
+
+        Returns:
+            (window_start, window_end) character offsets aligned to line boundaries
+        """
+        window_start = content.rfind('\n', 0, start) + 1
+        for _ in range(DIFF_CONTEXT_LINES):
+            if window_start == 0:
+                break
+            window_start = content.rfind('\n', 0, window_start - 1) + 1
+
+        length = len(content)
+        window_end = end
+        for _ in range(DIFF_CONTEXT_LINES + 1):
+            if window_end >= length:
+                break
+            newline = content.find('\n', window_end)
+            window_end = length if newline < 0 else newline + 1
+
+        return window_start, window_end
+
+    def replace_text(self, file_path: str, old_text: str, new_text: str, count: int = 1, dry_run: bool = False,
+                     include_diff: bool = True) -> Dict[str, Any]:
         """
         Replace a specific string in a file.
 
@@ -70,12 +455,14 @@ class EditFileTool:
             count: The number of occurrences to replace. Defaults to 1.
                    If set to 0, all occurrences will be replaced.
             dry_run: If True, show diff without writing changes. Defaults to False.
+            include_diff: If False, skip generating the diff when writing changes.
+                          Dry runs always include the diff. Defaults to True.
 
         Returns:
             A dictionary indicating success or failure.
         """
         try:
-            target_path = self.base_path / file_path
+            target_path = os.path.join(self._base_str, file_path)
 
             # Security check: ensure we're not escaping base_path
             if not self._is_safe_path(target_path):
@@ -84,37 +471,75 @@ class EditFileTool:
                     "error": "Access denied: Path is outside allowed directory"
                 }
 
-            if not target_path.exists():
+            try:
+                file_stat = os.stat(target_path)
+            except (FileNotFoundError, NotADirectoryError):
                 return {
                     "success": False,
                     "error": f"File does not exist: {file_path}"
                 }
 
-            if not target_path.is_file():
+            if not stat.S_ISREG(file_stat.st_mode):
                 return {
                     "success": False,
                     "error": f"Path is not a file: {file_path}"
                 }
 
+            # Large single replacements without a diff are done on a memory map,
+            # avoiding decoding the whole file into a string. The file is replaced
+            # by a new one, so this is only done for files with a single link.
+            if count == 1 and not dry_run and not include_diff and old_text != new_text:
+                if file_stat.st_size > MMAP_THRESHOLD and file_stat.st_nlink == 1:
+                    # Edit the file itself, not a symlink pointing at it
+                    if self._replace_first_mapped(os.path.realpath(target_path), old_text, new_text):
+                        return {
+                            "success": True,
+                            "message": f"Successfully replaced text in {file_path}.",
+                            "diff": ""
+                        }
+
             # Read the file content
             with open(target_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            # Check if old_text exists
-            if old_text not in content:
+            # Locate the first occurrence; this also checks that old_text exists
+            idx = content.find(old_text)
+            if idx < 0:
                 return {
                     "success": False,
                     "error": f"The specified 'old_text' was not found in the file."
                 }
 
             # Perform the replacement
-            if count == 0:
-                new_content = content.replace(old_text, new_text)
+            if count == 1:
+                new_content = content[:idx] + new_text + content[idx + len(old_text):]
             else:
-                new_content = content.replace(old_text, new_text, count)
+                new_content = content.replace(old_text, new_text, count if count else -1)
 
-            # Generate diff
-            diff = self._generate_diff(content, new_content, file_path)
+            if dry_run:
+                if count == 1:
+                    changes_count = 1
+                elif count == 0:
+                    changes_count = content.count(old_text)
+                else:
+                    changes_count = min(count, content.count(old_text))
+
+            # Nothing to diff or write if the replacement is a no-op
+            if new_content == content:
+                result = {
+                    "success": True,
+                    "message": f"No changes needed in {file_path}.",
+                    "diff": ""
+                }
+                if dry_run:
+                    result.update(dry_run=True, changes_count=changes_count)
+                return result
+
+            # Generate diff, limited to the edited region for single replacements
+            diff = ""
+            if include_diff or dry_run:
+                change = (idx, idx + len(old_text), idx + len(new_text)) if count == 1 else None
+                diff = self._generate_diff(content, new_content, file_path, change)
 
             # If dry run, return diff without writing
             if dry_run:
@@ -123,7 +548,7 @@ class EditFileTool:
                     "dry_run": True,
                     "message": f"Dry run completed for {file_path}. No changes written.",
                     "diff": diff,
-                    "changes_count": content.count(old_text) if count == 0 else min(count, content.count(old_text))
+                    "changes_count": changes_count
                 }
 
             # Write the modified content back to the file
@@ -142,23 +567,27 @@ class EditFileTool:
                 "error": f"Error editing file: {str(e)}"
             }
 
-    def regex_replace(self, file_path: str, pattern: str, replacement: str, count: int = 0, flags: int = 0, dry_run: bool = False) -> Dict[str, Any]:
+    def replace_text_batch(self, file_path: str, edits: List[Dict[str, Any]], dry_run: bool = False,
+                           include_diff: bool = True) -> Dict[str, Any]:
         """
-        Replace text in a file using regular expressions.
+        Apply several text replacements to a file in a single read and write.
+
+        Edits are applied in order, so each edit sees the result of the previous
+        ones. If any old_text is not found, no changes are written.
 
         Args:
             file_path: Path to the file to edit.
-            pattern: Regular expression pattern to search for.
-            replacement: Replacement string (can include backreferences like \\1, \\2, etc.).
-            count: Maximum number of replacements. 0 means replace all. Defaults to 0.
-            flags: Regex flags (0=none, 1=IGNORECASE, 2=MULTILINE, 4=DOTALL). Can be combined by adding.
+            edits: List of edits, each a dictionary with "old_text", "new_text" and
+                   an optional "count" (defaults to 1, 0 replaces all occurrences).
             dry_run: If True, show diff without writing changes. Defaults to False.
+            include_diff: If False, skip generating the diff when writing changes.
+                          Dry runs always include the diff. Defaults to True.
 
         Returns:
             A dictionary indicating success or failure.
         """
         try:
-            target_path = self.base_path / file_path
+            target_path = os.path.join(self._base_str, file_path)
 
             # Security check: ensure we're not escaping base_path
             if not self._is_safe_path(target_path):
@@ -167,56 +596,193 @@ class EditFileTool:
                     "error": "Access denied: Path is outside allowed directory"
                 }
 
-            if not target_path.exists():
+            try:
+                file_stat = os.stat(target_path)
+            except (FileNotFoundError, NotADirectoryError):
                 return {
                     "success": False,
                     "error": f"File does not exist: {file_path}"
                 }
 
-            if not target_path.is_file():
+            if not stat.S_ISREG(file_stat.st_mode):
                 return {
                     "success": False,
                     "error": f"Path is not a file: {file_path}"
                 }
 
+            if not edits:
+                return {
+                    "success": False,
+                    "error": "No edits were provided."
+                }
+
             # Read the file content
             with open(target_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            # Convert flags integer to re flags
-            re_flags = 0
-            if flags & 1:  # IGNORECASE
-                re_flags |= re.IGNORECASE
-            if flags & 2:  # MULTILINE
-                re_flags |= re.MULTILINE
-            if flags & 4:  # DOTALL
-                re_flags |= re.DOTALL
-
-            # Try to compile the pattern to check for errors
+            # Apply every edit in memory
+            new_content = content
+            for number, edit in enumerate(edits, 1):
+                old_text = edit.get("old_text")
+                new_text = edit.get("new_text")
+                if not isinstance(old_text, str) or not isinstance(new_text, str):
+                    return {
+                        "success": False,
+                        "error": f"Edit {number} must provide 'old_text' and 'new_text' strings."
+                    }
+
+                if old_text not in new_content:
+                    return {
+                        "success": False,
+                        "error": f"Edit {number}: the specified 'old_text' was not found in the file."
+                    }
+
+                count = edit.get("count", 1)
+                new_content = new_content.replace(old_text, new_text, count if count else -1)
+
+            # Nothing to diff or write if the edits cancel out
+            if new_content == content:
+                result = {
+                    "success": True,
+                    "message": f"No changes needed in {file_path}.",
+                    "diff": ""
+                }
+                if dry_run:
+                    result.update(dry_run=True, edits_count=len(edits))
+                return result
+
+            # Generate one diff covering all edits
+            diff = ""
+            if include_diff or dry_run:
+                diff = self._generate_diff(content, new_content, file_path)
+
+            # If dry run, return diff without writing
+            if dry_run:
+                return {
+                    "success": True,
+                    "dry_run": True,
+                    "message": f"Dry run completed for {file_path}. No changes written.",
+                    "diff": diff,
+                    "edits_count": len(edits)
+                }
+
+            # Write the modified content back to the file
+            with open(target_path, 'w', encoding='utf-8') as f:
+                f.write(new_content)
+
+            return {
+                "success": True,
+                "message": f"Successfully applied {len(edits)} edit(s) to {file_path}.",
+                "diff": diff,
+                "edits_count": len(edits)
+            }
+
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Error editing file: {str(e)}"
+            }
+
+    def regex_replace(self, file_path: str, pattern: str, replacement: str, count: int = 0, flags: int = 0,
+                      dry_run: bool = False, include_diff: bool = True) -> Dict[str, Any]:
+        """
+        Replace text in a file using regular expressions.
+
+        Args:
+            file_path: Path to the file to edit.
+            pattern: Regular expression pattern to search for.
+            replacement: Replacement string (can include backreferences like \\1, \\2, etc.).
+            count: Maximum number of replacements. 0 means replace all. Defaults to 0.
+            flags: Regex flags (0=none, 1=IGNORECASE, 2=MULTILINE, 4=DOTALL). Can be combined by adding.
+            dry_run: If True, show diff without writing changes. Defaults to False.
+            include_diff: If False, skip generating the diff when writing changes.
+                          Dry runs always include the diff. Defaults to True.
+
+        Returns:
+            A dictionary indicating success or failure.
+        """
+        try:
+            target_path = os.path.join(self._base_str, file_path)
+
+            # Security check: ensure we're not escaping base_path
+            if not self._is_safe_path(target_path):
+                return {
+                    "success": False,
+                    "error": "Access denied: Path is outside allowed directory"
+                }
+
             try:
-                compiled_pattern = re.compile(pattern, re_flags)
-            except re.error as e:
+                file_stat = os.stat(target_path)
+            except (FileNotFoundError, NotADirectoryError):
                 return {
                     "success": False,
-                    "error": f"Invalid regex pattern: {str(e)}"
+                    "error": f"File does not exist: {file_path}"
                 }
 
-            # Check if pattern matches anything
-            matches = compiled_pattern.findall(content)
-            if not matches:
+            if not stat.S_ISREG(file_stat.st_mode):
                 return {
                     "success": False,
-                    "error": f"The regex pattern did not match anything in the file."
+                    "error": f"Path is not a file: {file_path}"
                 }
 
-            # Perform the replacement
-            new_content = compiled_pattern.sub(replacement, content, count=count)
+            # Read the file content
+            with open(target_path, 'r', encoding='utf-8') as f:
+                content = f.read()
 
-            # Generate diff
-            diff = self._generate_diff(content, new_content, file_path)
+            # Convert flags integer to re flags
+            re_flags = _REGEX_FLAGS[flags & 7]
+
+            if self._is_literal_substitution(pattern, replacement, count, re_flags):
+                # Plain text pattern and replacement: plain string replacement is equivalent
+                matches_found = content.count(pattern)
+                if not matches_found:
+                    return {
+                        "success": False,
+                        "error": f"The regex pattern did not match anything in the file."
+                    }
+
+                replacements_made = matches_found if count == 0 else min(count, matches_found)
+                new_content = content.replace(pattern, replacement, count if count else -1)
+            else:
+                # Try to compile the pattern to check for errors
+                try:
+                    compiled_pattern = _compile_pattern(pattern, re_flags)
+                except re.error as e:
+                    return {
+                        "success": False,
+                        "error": f"Invalid regex pattern: {str(e)}"
+                    }
+
+                # Perform the replacement; subn also reports how many substitutions were made
+                new_content, replacements_made = compiled_pattern.subn(replacement, content, count=count)
+                if not replacements_made:
+                    return {
+                        "success": False,
+                        "error": f"The regex pattern did not match anything in the file."
+                    }
+
+                # Only a replacement limit that was reached can hide further matches
+                matches_found = replacements_made
+                if count and replacements_made == count:
+                    matches_found = sum(1 for _ in compiled_pattern.finditer(content))
+
+            # Nothing to diff or write if the substitution is a no-op
+            if new_content == content:
+                result = {
+                    "success": True,
+                    "message": f"No changes needed in {file_path}.",
+                    "diff": "",
+                    "matches_found": matches_found,
+                    "replacements_count": replacements_made
+                }
+                if dry_run:
+                    result["dry_run"] = True
+                return result
 
-            # Count actual replacements made
-            replacements_made = len(matches) if count == 0 else min(count, len(matches))
+            # Generate diff
+            diff = ""
+            if include_diff or dry_run:
+                diff = self._generate_diff(content, new_content, file_path)
 
             # If dry run, return diff without writing
             if dry_run:
@@ -225,7 +791,7 @@ class EditFileTool:
                     "dry_run": True,
                     "message": f"Dry run completed for {file_path}. No changes written.",
                     "diff": diff,
-                    "matches_found": len(matches),
+                    "matches_found": matches_found,
                     "replacements_count": replacements_made
                 }
 
@@ -237,7 +803,7 @@ class EditFileTool:
                 "success": True,
                 "message": f"Successfully replaced {replacements_made} occurrence(s) in {file_path}.",
                 "diff": diff,
-                "matches_found": len(matches),
+                "matches_found": matches_found,
                 "replacements_count": replacements_made
             }
 
@@ -247,101 +813,93 @@ class EditFileTool:
                 "error": f"Error editing file: {str(e)}"
             }
 
-    def get_tool_spec(self) -> Dict[str, Any]:
+    def _is_literal_substitution(self, pattern: str, replacement: str, count: int, re_flags: int) -> bool:
+        """
+        Check whether a regex substitution behaves exactly like str.replace.
+
+        This holds when the pattern has no regex metacharacters, the replacement
+        has no escapes or backreferences, and case-insensitive matching is off.
+
+        Args:
+            pattern: Regular expression pattern
+            replacement: Replacement string
+            count: Maximum number of replacements (0 means all)
+            re_flags: Flags from the re module
+
+        Returns:
+            True if the substitution can be done with str.replace
+        """
+        return (
+            bool(pattern)
+            and count >= 0
+            and not re_flags & re.IGNORECASE
+            and '\\' not in replacement
+            and not _REGEX_METACHARACTERS.search(pattern)
+        )
+
+    def _replace_first_mapped(self, path: str, old_text: str, new_text: str) -> bool:
+        """
+        Replace the first occurrence of old_text by searching a memory map of the file.
+
+        The bytes before and after the match are passed straight from the map,
+        together with the replacement, to a single vectored write into a
+        temporary file, which then replaces the original.
+
+        Args:
+            path: File to edit
+            old_text: The exact text to be replaced
+            new_text: The replacement text
+
+        Returns:
+            True if the file was rewritten; False if old_text was not found or
+            the file must go through the text path instead (it is not valid
+            UTF-8, which the text path reports, or contains carriage returns,
+            which the text path's newline translation would change)
+        """
+        old_bytes = old_text.encode('utf-8')
+
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            idx = mm.find(old_bytes)
+            if idx < 0 or mm.find(b'\r') >= 0 or not self._is_utf8(mm):
+                return False
+
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}.")
+            try:
+                try:
+                    with memoryview(mm) as view:
+                        _write_all(fd, [view[:idx], new_text.encode('utf-8'), view[idx + len(old_bytes):]])
+                finally:
+                    os.close(fd)
+                shutil.copymode(path, tmp_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+        os.replace(tmp_path, path)
+        return True
+
+    def _is_utf8(self, data: mmap.mmap) -> bool:
+        """Check that a memory map holds valid UTF-8, one chunk at a time."""
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        try:
+            with memoryview(data) as view:
+                for start in range(0, len(view), _VALIDATE_CHUNK):
+                    decoder.decode(view[start:start + _VALIDATE_CHUNK])
+            decoder.decode(b'', final=True)
+        except UnicodeDecodeError:
+            return False
+        return True
+
+    def get_tool_spec(self) -> Mapping[str, Any]:
         """
         Get the tool specification for AI agent integration.
 
         Returns:
             Dict containing tool name, methods, parameters, and metadata
         """
-        return {
-            "tool_name": self.tool_name,
-            "description": "A tool for editing files with text replacement and regex support. Supports dry-run mode to preview changes.",
-            "version": "2.0.0",
-            "methods": [
-                {
-                    "name": "replace_text",
-                    "description": "Replaces a specific string of text in a file. Supports dry-run mode to preview changes before applying them.",
-                    "parameters": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "The relative path to the file to be edited.",
-                            "required": True
-                        },
-                        "old_text": {
-                            "type": "string",
-                            "description": "The exact block of text to be found and replaced. Must be an exact match.",
-                            "required": True
-                        },
-                        "new_text": {
-                            "type": "string",
-                            "description": "The new block of text that will replace the old_text.",
-                            "required": True
-                        },
-                        "count": {
-                            "type": "integer",
-                            "description": "The number of occurrences to replace. Set to 1 for the first match, or 0 to replace all matches.",
-                            "required": False,
-                            "default": 1
-                        },
-                        "dry_run": {
-                            "type": "boolean",
-                            "description": "If True, preview changes with a diff without writing to the file. Use this to verify changes before applying them.",
-                            "required": False,
-                            "default": False
-                        }
-                    },
-                    "returns": "A dictionary with success status, diff, and message. In dry_run mode, includes the diff preview without modifying the file.",
-                    "destruct_flag": True
-                },
-                {
-                    "name": "regex_replace",
-                    "description": "Replace text in a file using regular expressions. Supports backreferences and advanced pattern matching. Supports dry-run mode.",
-                    "parameters": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "The relative path to the file to be edited.",
-                            "required": True
-                        },
-                        "pattern": {
-                            "type": "string",
-                            "description": "Regular expression pattern to search for. Use standard Python regex syntax.",
-                            "required": True
-                        },
-                        "replacement": {
-                            "type": "string",
-                            "description": "Replacement string. Can include backreferences like \\1, \\2 for captured groups.",
-                            "required": True
-                        },
-                        "count": {
-                            "type": "integer",
-                            "description": "Maximum number of replacements to make. 0 means replace all matches.",
-                            "required": False,
-                            "default": 0
-                        },
-                        "flags": {
-                            "type": "integer",
-                            "description": "Regex flags: 0=none, 1=IGNORECASE, 2=MULTILINE, 4=DOTALL. Combine by adding (e.g., 3=IGNORECASE+MULTILINE).",
-                            "required": False,
-                            "default": 0
-                        },
-                        "dry_run": {
-                            "type": "boolean",
-                            "description": "If True, preview changes with a diff without writing to the file.",
-                            "required": False,
-                            "default": False
-                        }
-                    },
-                    "returns": "A dictionary with success status, diff, matches found, and replacements count.",
-                    "destruct_flag": True
-                }
-            ]
-        }
+        return _TOOL_SPEC
 
-    def _is_safe_path(self, path: Path) -> bool:
+    def _is_safe_path(self, path: str) -> bool:
         """Check if path is within allowed directory."""
-        try:
-            path.resolve().relative_to(self.base_path.resolve())
-            return True
-        except ValueError:
-            return False
+        resolved = os.path.realpath(path)
+        return resolved == self._base_resolved or resolved.startswith(self._base_prefix)
@@ -12,9 +12,184 @@ The tool provides:
 """
 
 import os
+import re
+import stat
+import fnmatch
+import itertools
+import mmap
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import Callable, Dict, Mapping, Iterator, List, Optional, Any, Tuple
+
+from tools._spec import freeze_spec
+
+
+# Buffer size for line-range reads
+READ_BUFFER_SIZE = 64 * 1024
+
+# Whole-file reads of at least this many bytes are decoded from a memory map
+MMAP_READ_THRESHOLD = 256 * 1024
+
+# Default cap on the number of items returned by list_directory
+DEFAULT_MAX_ITEMS = 10000
+
+# Upper limit on search_files' max_workers, however many are requested
+MAX_SEARCH_WORKERS = 32
+
+
+def _format_time(timestamp: float) -> str:
+    """Format a stat timestamp as local ISO 8601 time, to the second."""
+    # time.strftime avoids creating a datetime object for every entry
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(timestamp))
+
+
+_TOOL_SPEC = freeze_spec({
+    "tool_name": "FILE_EXPLORER",
+    "description": "File system exploration tool for reading and navigating directories",
+    "version": "1.0.0",
+    "methods": [
+        {
+            "name": "list_directory",
+            "description": "List files and directories in a specified path",
+            "parameters": {
+                "path": {
+                    "type": "string",
+                    "description": "Directory path to list (relative)",
+                    "required": False,
+                    "default": "."
+                },
+                "recursive": {
+                    "type": "boolean",
+                    "description": "Whether to list recursively",
+                    "required": False,
+                    "default": False
+                },
+                "max_depth": {
+                    "type": "integer",
+                    "description": "Maximum depth for recursive listing",
+                    "required": False,
+                    "default": 3
+                },
+                "max_items": {
+                    "type": "integer",
+                    "description": "Maximum number of items to return. The result has truncated=True if more items exist.",
+                    "required": False,
+                    "default": DEFAULT_MAX_ITEMS
+                },
+                "minimal": {
+                    "type": "boolean",
+                    "description": "Return only name, path and type for each item (no size or modification time). Much faster on large directories.",
+                    "required": False,
+                    "default": False
+                }
+            },
+            "returns": "Dictionary with directory listing and metadata",
+            "destruct_flag": False
+        },
+        {
+            "name": "read_file",
+            "description": "Read the contents of a text file, with optional line range selection to avoid context overflow",
+            "parameters": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the file to read",
+                    "required": True
+                },
+                "max_size": {
+                    "type": "integer",
+                    "description": "Maximum file size in bytes (only enforced when reading entire file)",
+                    "required": False,
+                    "default": 1048576
+                },
+                "start_line": {
+                    "type": "integer",
+                    "description": "Starting line number (1-indexed). If specified, reads from this line. If None, reads from beginning.",
+                    "required": False,
+                    "default": None
+                },
+                "line_count": {
+                    "type": "integer",
+                    "description": "Number of lines to read starting from start_line. If None, reads to end of file.",
+                    "required": False,
+                    "default": None
+                }
+            },
+            "returns": "Dictionary with file contents, metadata, and line range information",
+            "destruct_flag": False
+        },
+        {
+            "name": "read_files",
+            "description": "Read several whole text files in one call",
+            "parameters": {
+                "file_paths": {
+                    "type": "array",
+                    "description": "Paths of the files to read",
+                    "required": True
+                },
+                "max_size": {
+                    "type": "integer",
+                    "description": "Maximum size of each file in bytes",
+                    "required": False,
+                    "default": 1048576
+                }
+            },
+            "returns": "Dictionary with one read_file-style result per file, in the requested order",
+            "destruct_flag": False
+        },
+        {
+            "name": "get_file_info",
+            "description": "Get detailed information about a file or directory",
+            "parameters": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the file/directory",
+                    "required": True
+                }
+            },
+            "returns": "Dictionary with file metadata",
+            "destruct_flag": False
+        },
+        {
+            "name": "search_files",
+            "description": "Search for files matching a pattern",
+            "parameters": {
+                "pattern": {
+                    "type": "string",
+                    "description": "File name pattern (supports wildcards)",
+                    "required": True
+                },
+                "search_path": {
+                    "type": "string",
+                    "description": "Directory to search in",
+                    "required": False,
+                    "default": "."
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of results",
+                    "required": False,
+                    "default": 100
+                },
+                "max_workers": {
+                    "type": "integer",
+                    "description": "Number of threads scanning directories concurrently (at most 32). Values above 1 speed up searches on slow or network filesystems; results are then unordered.",
+                    "required": False,
+                    "default": 1
+                },
+                "include_size": {
+                    "type": "boolean",
+                    "description": "Report the size of matched files (costs one stat per match)",
+                    "required": False,
+                    "default": False
+                }
+            },
+            "returns": "Dictionary with search results",
+            "destruct_flag": False
+        }
+    ]
+})
 
 
 class FileExplorerTool:
@@ -34,9 +209,13 @@ class FileExplorerTool:
             base_path: Optional base path to restrict access (default: current directory)
         """
         self.base_path = Path(base_path) if base_path else Path.cwd()
+        self._base_str = os.fspath(self.base_path)
+        self._base_resolved = os.path.realpath(self.base_path)
+        self._base_prefix = os.path.join(self._base_resolved, '')
         self.tool_name = "FILE_EXPLORER"
     
-    def list_directory(self, path: str = ".", recursive: bool = False, max_depth: int = 3) -> Dict[str, Any]:
+    def list_directory(self, path: str = ".", recursive: bool = False, max_depth: int = 3,
+                       max_items: Optional[int] = DEFAULT_MAX_ITEMS, minimal: bool = False) -> Dict[str, Any]:
         """
         List files and directories in the specified path.
         
@@ -44,12 +223,24 @@ class FileExplorerTool:
             path: Directory path to list (relative to base_path)
             recursive: Whether to list recursively
             max_depth: Maximum depth for recursive listing
+            max_items: Maximum number of items to return. The walk stops once the
+                       limit is exceeded and the result is marked truncated, which
+                       bounds the time and memory spent on very large trees.
+                       If None, all items are returned
+            minimal: If True, items only contain name, path (relative to base_path)
+                     and type, which avoids a stat call per item
             
         Returns:
             Dict containing directory listing and metadata
         """
+        if max_items is not None and max_items < 0:
+            return {
+                "success": False,
+                "error": f"max_items must not be negative (got {max_items})"
+            }
+        
         try:
-            target_path = self.base_path / path
+            target_path = os.path.join(self._base_str, path)
             
             # Security check: ensure we're not escaping base_path
             if not self._is_safe_path(target_path):
@@ -58,40 +249,74 @@ class FileExplorerTool:
                     "error": "Access denied: Path is outside allowed directory"
                 }
             
-            if not target_path.exists():
+            try:
+                st = os.stat(target_path)
+            except (FileNotFoundError, NotADirectoryError):
                 return {
                     "success": False,
                     "error": f"Path does not exist: {path}"
                 }
             
-            if not target_path.is_dir():
+            if not stat.S_ISDIR(st.st_mode):
                 return {
                     "success": False,
                     "error": f"Path is not a directory: {path}"
                 }
             
-            # List directory contents
-            items = []
-            
-            if recursive:
-                items = self._list_recursive(target_path, max_depth)
+            # List directory contents, reading at most one item past the limit
+            items_iter = self._iter_items(target_path, recursive, max_depth, minimal)
+            if max_items is None:
+                items = list(items_iter)
             else:
-                for item in sorted(target_path.iterdir()):
-                    items.append(self._get_item_info(item))
+                items = list(itertools.islice(items_iter, max_items + 1))
+            
+            truncated = max_items is not None and len(items) > max_items
+            if truncated:
+                items.pop()
             
             return {
                 "success": True,
-                "path": str(target_path.relative_to(self.base_path)),
+                "path": self._relative(target_path),
                 "items": items,
-                "count": len(items)
+                "count": len(items),
+                "truncated": truncated
             }
             
-        except Exception as e:
+        except OSError as e:
             return {
                 "success": False,
                 "error": f"Error listing directory: {str(e)}"
             }
     
+    def iter_directory(self, path: str = ".", recursive: bool = False, max_depth: int = 3,
+                       minimal: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield the items of a directory listing.
+        
+        Items are produced in the same order and shape as list_directory's
+        "items", but only one directory is read at a time, so callers can stop
+        early without the whole tree being walked.
+        
+        Args:
+            path: Directory path to list (relative to base_path)
+            recursive: Whether to list recursively
+            max_depth: Maximum depth for recursive listing
+            minimal: If True, items only contain name, path and type
+            
+        Yields:
+            Item info dictionaries ("depth" is included for recursive listings)
+            
+        Raises:
+            PermissionError: If the path is outside the allowed directory
+            OSError: If the directory cannot be read
+        """
+        target_path = os.path.join(self._base_str, path)
+        
+        if not self._is_safe_path(target_path):
+            raise PermissionError("Access denied: Path is outside allowed directory")
+        
+        yield from self._iter_items(target_path, recursive, max_depth, minimal)
+    
     def read_file(self, file_path: str, max_size: int = 1024 * 1024,
                  start_line: Optional[int] = None, line_count: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -136,42 +361,39 @@ class FileExplorerTool:
                     "error": f"File too large: {file_size} bytes (max: {max_size} bytes). Use start_line and line_count to read specific portions."
                 }
             
-            # Read file contents
-            try:
-                with open(target_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-            except UnicodeDecodeError:
-                return {
-                    "success": False,
-                    "error": "File is not a text file or uses unsupported encoding"
-                }
-            
-            total_lines = len(lines)
-            
             # Handle line range selection
             if start_line is not None:
                 # Convert to 0-indexed
                 start_idx = max(0, start_line - 1)
+                end_idx = None if line_count is None else start_idx + max(0, line_count)
                 
-                if start_idx >= total_lines:
+                # Decode only up to the end of the requested range, reading in large blocks
+                try:
+                    with open(target_path, 'r', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f:
+                        selected_lines = list(itertools.islice(f, start_idx, end_idx))
+                except UnicodeDecodeError:
                     return {
                         "success": False,
-                        "error": f"start_line {start_line} exceeds file length ({total_lines} lines)"
+                        "error": "File is not a text file or uses unsupported encoding"
                     }
                 
-                # Calculate end index
-                if line_count is not None:
-                    end_idx = min(start_idx + line_count, total_lines)
+                # The total is known if the range ran into the end of the file
+                if selected_lines and (end_idx is None or start_idx + len(selected_lines) < end_idx):
+                    total_lines = start_idx + len(selected_lines)
                 else:
-                    end_idx = total_lines
+                    total_lines = self._count_lines(target_path)
+                
+                if start_idx >= total_lines:
+                    return {
+                        "success": False,
+                        "error": f"start_line {start_line} exceeds file length ({total_lines} lines)"
+                    }
                 
-                # Extract the requested lines
-                selected_lines = lines[start_idx:end_idx]
                 content = ''.join(selected_lines)
                 
                 return {
                     "success": True,
-                    "path": str(target_path.relative_to(self.base_path)),
+                    "path": self._relative(target_path),
                     "content": content,
                     "total_lines": total_lines,
                     "start_line": start_line,
@@ -181,25 +403,117 @@ class FileExplorerTool:
                     "partial_read": True
                 }
             else:
-                # Read entire file
-                content = ''.join(lines)
+                # Read entire file as bytes and decode it in one step
+                try:
+                    content = self._read_text(target_path, file_size)
+                except UnicodeDecodeError:
+                    return {
+                        "success": False,
+                        "error": "File is not a text file or uses unsupported encoding"
+                    }
                 
-                return {
-                    "success": True,
-                    "path": str(target_path.relative_to(self.base_path)),
-                    "content": content,
-                    "total_lines": total_lines,
-                    "lines_read": total_lines,
-                    "size": file_size,
-                    "partial_read": False
-                }
+                return self._whole_file_result(target_path, content, file_size)
             
-        except Exception as e:
+        except OSError as e:
             return {
                 "success": False,
                 "error": f"Error reading file: {str(e)}"
             }
     
+    def read_files(self, file_paths: List[str], max_size: int = 1024 * 1024) -> Dict[str, Any]:
+        """
+        Read several whole text files in one call.
+        
+        Saves the agent one tool call per file; the files are read one after
+        another with the same checks and result shape as read_file.
+        
+        Args:
+            file_paths: Paths to the files (relative to base_path)
+            max_size: Maximum size of each file in bytes (default: 1MB)
+            
+        Returns:
+            Dict with one read_file-style result per path, in order
+        """
+        # A plain string would otherwise be read one character at a time
+        if not isinstance(file_paths, (list, tuple)) or not all(isinstance(file_path, str) for file_path in file_paths):
+            return {
+                "success": False,
+                "error": "'file_paths' must be a list of file paths."
+            }
+        
+        files: List[Dict[str, Any]] = []
+        
+        for file_path in file_paths:
+            target_path = self.base_path / file_path
+            if not self._is_safe_path(target_path):
+                files.append({
+                    "success": False,
+                    "error": "Access denied: Path is outside allowed directory"
+                })
+                continue
+            
+            try:
+                st = os.stat(target_path)
+            except OSError:
+                files.append({
+                    "success": False,
+                    "error": f"File does not exist: {file_path}"
+                })
+                continue
+            
+            if not stat.S_ISREG(st.st_mode):
+                files.append({
+                    "success": False,
+                    "error": f"Path is not a file: {file_path}"
+                })
+                continue
+            if st.st_size > max_size:
+                files.append({
+                    "success": False,
+                    "error": f"File too large: {st.st_size} bytes (max: {max_size} bytes). Use read_file with start_line and line_count to read specific portions."
+                })
+                continue
+            
+            try:
+                data = target_path.read_bytes()
+                files.append(self._whole_file_result(target_path, data.decode('utf-8'), len(data)))
+            except UnicodeDecodeError:
+                files.append({
+                    "success": False,
+                    "error": "File is not a text file or uses unsupported encoding"
+                })
+            except OSError as e:
+                files.append({
+                    "success": False,
+                    "error": f"Error reading file: {str(e)}"
+                })
+        
+        return {
+            "success": True,
+            "files": files,
+            "count": len(files)
+        }
+    
+    def _whole_file_result(self, target_path, content: str, file_size: int) -> Dict[str, Any]:
+        """Build the read_file result for a whole decoded file."""
+        # Translate line endings the way text mode reads do
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        
+        total_lines = content.count('\n')
+        if content and not content.endswith('\n'):
+            total_lines += 1
+        
+        return {
+            "success": True,
+            "path": self._relative(target_path),
+            "content": content,
+            "total_lines": total_lines,
+            "lines_read": total_lines,
+            "size": file_size,
+            "partial_read": False
+        }
+    
     def get_file_info(self, file_path: str) -> Dict[str, Any]:
         """
         Get detailed information about a file or directory.
@@ -220,33 +534,35 @@ class FileExplorerTool:
                     "error": "Access denied: Path is outside allowed directory"
                 }
             
-            if not target_path.exists():
+            # A single stat both checks existence and provides all metadata
+            try:
+                st = os.stat(target_path)
+            except (FileNotFoundError, NotADirectoryError):
                 return {
                     "success": False,
                     "error": f"Path does not exist: {file_path}"
                 }
             
-            stat = target_path.stat()
-            
             return {
                 "success": True,
-                "path": str(target_path.relative_to(self.base_path)),
+                "path": self._relative(target_path),
                 "name": target_path.name,
-                "type": "directory" if target_path.is_dir() else "file",
-                "size": stat.st_size,
-                "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "extension": target_path.suffix if target_path.is_file() else None
+                "type": "directory" if stat.S_ISDIR(st.st_mode) else "file",
+                "size": st.st_size,
+                "created": _format_time(st.st_ctime),
+                "modified": _format_time(st.st_mtime),
+                "extension": target_path.suffix if stat.S_ISREG(st.st_mode) else None
             }
             
-        except Exception as e:
+        except OSError as e:
             return {
                 "success": False,
                 "error": f"Error getting file info: {str(e)}"
             }
     
     def search_files(self, pattern: str, search_path: str = ".", 
-                    max_results: int = 100) -> Dict[str, Any]:
+                    max_results: int = 100, max_workers: int = 1,
+                    include_size: bool = False) -> Dict[str, Any]:
         """
         Search for files matching a pattern.
         
@@ -254,12 +570,18 @@ class FileExplorerTool:
             pattern: File name pattern (supports wildcards like *.py)
             search_path: Directory to search in (relative to base_path)
             max_results: Maximum number of results to return
+            max_workers: Number of threads scanning directories concurrently
+                         (at most MAX_SEARCH_WORKERS). Values above 1 help on
+                         network or FUSE filesystems, but results are then
+                         returned in no particular order
+            include_size: Whether to stat matched files to report their size.
+                          When False, "size" is None and no per-file stat is made
             
         Returns:
             Dict containing search results
         """
         try:
-            target_path = self.base_path / search_path
+            target_path = os.path.join(self._base_str, search_path)
             
             # Security check
             if not self._is_safe_path(target_path):
@@ -268,195 +590,325 @@ class FileExplorerTool:
                     "error": "Access denied: Path is outside allowed directory"
                 }
             
-            if not target_path.exists():
+            if not os.path.exists(target_path):
                 return {
                     "success": False,
                     "error": f"Path does not exist: {search_path}"
                 }
             
-            # Search for files
-            results = []
-            for file_path in target_path.rglob(pattern):
-                if len(results) >= max_results:
-                    break
-                
-                results.append({
-                    "path": str(file_path.relative_to(self.base_path)),
-                    "name": file_path.name,
-                    "type": "directory" if file_path.is_dir() else "file",
-                    "size": file_path.stat().st_size if file_path.is_file() else None
-                })
+            results = self._search(target_path, pattern, max_results, max_workers, include_size)
             
             return {
                 "success": True,
                 "pattern": pattern,
-                "search_path": str(target_path.relative_to(self.base_path)),
+                "search_path": self._relative(target_path),
                 "results": results,
                 "count": len(results),
                 "truncated": len(results) >= max_results
             }
             
-        except Exception as e:
+        except OSError as e:
             return {
                 "success": False,
                 "error": f"Error searching files: {str(e)}"
             }
     
-    def get_tool_spec(self) -> Dict[str, Any]:
+    def _search(self, target_path: str, pattern: str, max_results: int,
+                max_workers: int, include_size: bool) -> List[Dict[str, Any]]:
+        """Walk target_path and collect up to max_results entries matching pattern."""
+        # Like rglob, the pattern may start at any depth. Patterns with a
+        # directory part are matched against the same number of trailing
+        # components of the relative path; a "**" inside the pattern spans
+        # a variable number of directories, so it needs the full matcher
+        name_pattern = pattern
+        while name_pattern.startswith("**/"):
+            name_pattern = name_pattern[3:]
+        if "**" in name_pattern.split("/"):
+            path_match = self._glob_matcher(["**"] + name_pattern.split("/"))
+        else:
+            path_match = None
+            pattern_parts = name_pattern.count("/") + 1
+            match = re.compile(fnmatch.translate(name_pattern)).match
+        search_prefix = self._relative(target_path)
+        
+        if max_workers > 1:
+            walker = self._walk_parallel(target_path, min(max_workers, MAX_SEARCH_WORKERS))
+        else:
+            walker = self._walk_scandir(target_path)
+        
+        # Search for files, stopping as soon as enough results are found
+        results = []
+        for entry, rel_path in walker:
+            if len(results) >= max_results:
+                break
+            
+            if path_match is not None:
+                if not path_match(rel_path.split(os.sep), entry):
+                    continue
+            else:
+                if pattern_parts > 1:
+                    name = "/".join(rel_path.split(os.sep)[-pattern_parts:])
+                else:
+                    name = entry.name
+                if not match(name):
+                    continue
+            
+            # DirEntry caches the file type from the directory listing,
+            # so only the optional size needs a stat call
+            is_dir = entry.is_dir()
+            results.append({
+                "path": rel_path if search_prefix == "." else os.path.join(search_prefix, rel_path),
+                "name": entry.name,
+                "type": "directory" if is_dir else "file",
+                "size": entry.stat().st_size if include_size and entry.is_file() else None
+            })
+        walker.close()
+        return results
+    
+    def _glob_matcher(self, parts: List[str]) -> Callable[[List[str], os.DirEntry], bool]:
+        """
+        Build a matcher for a glob pattern whose components include "**".
+
+        "**" matches zero or more whole path components; any other component
+        matches exactly one, with fnmatch wildcards. As with rglob, a pattern
+        ending in "**" only matches directories.
+
+        Args:
+            parts: The pattern's components
+            
+        Returns:
+            A function taking a relative path's components and its entry
+        """
+        matchers = [None if part == "**" else re.compile(fnmatch.translate(part)).match
+                    for part in parts]
+        end = len(matchers)
+        dirs_only = matchers[-1] is None
+        
+        def expand(states):
+            # A "**" may match nothing, so its state also stands for the next one
+            expanded = set(states)
+            for state in sorted(expanded):
+                while state < end and matchers[state] is None:
+                    state += 1
+                    expanded.add(state)
+            return expanded
+        
+        def path_match(components: List[str], entry: os.DirEntry) -> bool:
+            states = expand({0})
+            for component in components:
+                next_states = set()
+                for state in states:
+                    if state == end:
+                        continue
+                    matcher = matchers[state]
+                    if matcher is None:
+                        next_states.add(state)
+                    elif matcher(component):
+                        next_states.add(state + 1)
+                if not next_states:
+                    return False
+                states = expand(next_states)
+            return end in states and (not dirs_only or entry.is_dir())
+        
+        return path_match
+    
+    def get_tool_spec(self) -> Mapping[str, Any]:
         """
         Get the tool specification for AI agent integration.
         
         Returns:
             Dict containing tool name, methods, parameters, and metadata
         """
-        return {
-            "tool_name": self.tool_name,
-            "description": "File system exploration tool for reading and navigating directories",
-            "version": "1.0.0",
-            "methods": [
-                {
-                    "name": "list_directory",
-                    "description": "List files and directories in a specified path",
-                    "parameters": {
-                        "path": {
-                            "type": "string",
-                            "description": "Directory path to list (relative)",
-                            "required": False,
-                            "default": "."
-                        },
-                        "recursive": {
-                            "type": "boolean",
-                            "description": "Whether to list recursively",
-                            "required": False,
-                            "default": False
-                        },
-                        "max_depth": {
-                            "type": "integer",
-                            "description": "Maximum depth for recursive listing",
-                            "required": False,
-                            "default": 3
-                        }
-                    },
-                    "returns": "Dictionary with directory listing and metadata",
-                    "destruct_flag": False
-                },
-                {
-                    "name": "read_file",
-                    "description": "Read the contents of a text file, with optional line range selection to avoid context overflow",
-                    "parameters": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Path to the file to read",
-                            "required": True
-                        },
-                        "max_size": {
-                            "type": "integer",
-                            "description": "Maximum file size in bytes (only enforced when reading entire file)",
-                            "required": False,
-                            "default": 1048576
-                        },
-                        "start_line": {
-                            "type": "integer",
-                            "description": "Starting line number (1-indexed). If specified, reads from this line. If None, reads from beginning.",
-                            "required": False,
-                            "default": None
-                        },
-                        "line_count": {
-                            "type": "integer",
-                            "description": "Number of lines to read starting from start_line. If None, reads to end of file.",
-                            "required": False,
-                            "default": None
-                        }
-                    },
-                    "returns": "Dictionary with file contents, metadata, and line range information",
-                    "destruct_flag": False
-                },
-                {
-                    "name": "get_file_info",
-                    "description": "Get detailed information about a file or directory",
-                    "parameters": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Path to the file/directory",
-                            "required": True
-                        }
-                    },
-                    "returns": "Dictionary with file metadata",
-                    "destruct_flag": False
-                },
-                {
-                    "name": "search_files",
-                    "description": "Search for files matching a pattern",
-                    "parameters": {
-                        "pattern": {
-                            "type": "string",
-                            "description": "File name pattern (supports wildcards)",
-                            "required": True
-                        },
-                        "search_path": {
-                            "type": "string",
-                            "description": "Directory to search in",
-                            "required": False,
-                            "default": "."
-                        },
-                        "max_results": {
-                            "type": "integer",
-                            "description": "Maximum number of results",
-                            "required": False,
-                            "default": 100
-                        }
-                    },
-                    "returns": "Dictionary with search results",
-                    "destruct_flag": False
-                }
-            ]
-        }
+        return _TOOL_SPEC
     
     # Private helper methods
     
+    def _relative(self, path) -> str:
+        """Return path relative to base_path, using string operations only."""
+        return os.path.relpath(path, self._base_str)
+    
     def _is_safe_path(self, path: Path) -> bool:
         """Check if path is within allowed directory."""
+        resolved = os.path.realpath(path)
+        return resolved == self._base_resolved or resolved.startswith(self._base_prefix)
+    
+    def _walk_scandir(self, root) -> Iterator[Tuple[os.DirEntry, str]]:
+        """
+        Walk a directory tree with os.scandir, without following symlinks.
+        
+        Only one directory handle is open at a time; unreadable directories
+        are skipped.
+        
+        Yields:
+            (entry, relative_path) pairs, relative_path being relative to root
+        """
+        stack = deque([(root, "")])
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            try:
+                it = os.scandir(dir_path)
+            except OSError:
+                continue
+            
+            with it:
+                for entry in it:
+                    rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                    yield entry, rel_path
+                    
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, rel_path))
+    
+    def _read_text(self, path: Path, file_size: int) -> str:
+        """
+        Read a whole file and decode it as UTF-8.
+        
+        Large files are decoded straight from a read-only memory map, which
+        avoids the intermediate bytes copy that read_bytes() makes.
+        """
+        if file_size < MMAP_READ_THRESHOLD:
+            return path.read_bytes().decode('utf-8')
+        
+        with open(path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Not mappable (e.g. emptied since the size check)
+                return f.read().decode('utf-8')
+            with mm:
+                if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return str(mm, 'utf-8')
+    
+    def _count_lines(self, path) -> int:
+        """
+        Count the lines in a file by scanning its raw bytes for newlines.
+        
+        Lines end at \\n, \\r or \\r\\n, as in text mode reads.
+        """
+        total_lines = 0
+        last_chunk = b''
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(READ_BUFFER_SIZE), b''):
+                total_lines += chunk.count(b'\n') + chunk.count(b'\r') - chunk.count(b'\r\n')
+                # A \r\n split across two chunks was counted twice
+                if last_chunk.endswith(b'\r') and chunk.startswith(b'\n'):
+                    total_lines -= 1
+                last_chunk = chunk
+        if last_chunk and not last_chunk.endswith((b'\n', b'\r')):
+            total_lines += 1
+        return total_lines
+    
+    def _walk_parallel(self, root, max_workers: int) -> Iterator[Tuple[os.DirEntry, str]]:
+        """
+        Walk a directory tree like _walk_scandir, scanning directories on a thread pool.
+        
+        Each directory is read by a worker thread, so the blocking scandir calls
+        of several directories overlap. A worker closes its directory handle
+        before returning, so at most max_workers handles are open at once.
+        Entries are yielded in completion order.
+        
+        Yields:
+            (entry, relative_path) pairs, relative_path being relative to root
+        """
+        executor = ThreadPoolExecutor(max_workers=max_workers)
         try:
-            path.resolve().relative_to(self.base_path.resolve())
-            return True
-        except ValueError:
-            return False
+            pending = {executor.submit(self._read_directory, root): ""}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    rel_dir = pending.pop(future)
+                    for entry in future.result():
+                        rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                        yield entry, rel_path
+                        
+                        if entry.is_dir(follow_symlinks=False):
+                            pending[executor.submit(self._read_directory, entry.path)] = rel_path
+        finally:
+            # Stop queued scans if the caller stops early
+            executor.shutdown(wait=True, cancel_futures=True)
     
-    def _get_item_info(self, path: Path) -> Dict[str, Any]:
-        """Get basic info about a file/directory item."""
+    def _read_directory(self, path) -> List[os.DirEntry]:
+        """Return the entries of a directory, or an empty list if it cannot be read."""
         try:
-            stat = path.stat()
+            with os.scandir(path) as it:
+                return list(it)
+        except OSError:
+            return []
+    
+    def _scandir_sorted(self, path) -> List[os.DirEntry]:
+        """Return the entries of a directory sorted by name, closing the directory handle right away."""
+        with os.scandir(path) as it:
+            return sorted(it, key=lambda entry: entry.name)
+    
+    def _get_item_info(self, entry: os.DirEntry, rel_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get basic info about a file/directory item from its directory entry.
+        
+        When rel_path is given, only name, path and type are returned; the type
+        comes from the directory listing, so no stat call is made.
+        """
+        if rel_path is not None:
             return {
-                "name": path.name,
-                "type": "directory" if path.is_dir() else "file",
-                "size": stat.st_size if path.is_file() else None,
-                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
+                "name": entry.name,
+                "path": rel_path,
+                "type": "directory" if entry.is_dir() else "file"
             }
-        except Exception:
+        
+        try:
+            # The type is derived from the same stat result as size and mtime
+            st = entry.stat()
             return {
-                "name": path.name,
+                "name": entry.name,
+                "type": "directory" if stat.S_ISDIR(st.st_mode) else "file",
+                "size": st.st_size if stat.S_ISREG(st.st_mode) else None,
+                "modified": _format_time(st.st_mtime)
+            }
+        except OSError:
+            return {
+                "name": entry.name,
                 "type": "unknown",
                 "error": "Could not read file information"
             }
     
-    def _list_recursive(self, path: Path, max_depth: int, current_depth: int = 0) -> List[Dict[str, Any]]:
-        """Recursively list directory contents."""
-        items = []
+    def _iter_items(self, path, recursive: bool, max_depth: int,
+                    minimal: bool = False) -> Iterator[Dict[str, Any]]:
+        """Yield directory items depth-first, using an explicit stack instead of recursion."""
+        # Paths relative to base_path are only built for minimal listings
+        root = self._relative(path) if minimal else None
+        if root == ".":
+            root = ""
+        
+        if not recursive:
+            for entry in self._scandir_sorted(path):
+                yield self._get_item_info(entry, os.path.join(root, entry.name) if minimal else None)
+            return
         
-        if current_depth >= max_depth:
-            return items
+        if max_depth <= 0:
+            return
         
+        # Each stack entry holds the remaining entries of one open level,
+        # its depth and its path relative to base_path
         try:
-            for item in sorted(path.iterdir()):
-                item_info = self._get_item_info(item)
-                item_info["depth"] = current_depth
-                items.append(item_info)
-                
-                # Recurse into directories
-                if item.is_dir():
-                    sub_items = self._list_recursive(item, max_depth, current_depth + 1)
-                    items.extend(sub_items)
+            stack = deque([(iter(self._scandir_sorted(path)), 0, root)])
         except PermissionError:
-            pass  # Skip directories we can't access
+            return  # Skip directories we can't access
         
-        return items
+        while stack:
+            entries, depth, rel_dir = stack[-1]
+            entry = next(entries, None)
+            if entry is None:
+                stack.pop()
+                continue
+            
+            rel_path = os.path.join(rel_dir, entry.name) if minimal else None
+            item_info = self._get_item_info(entry, rel_path)
+            item_info["depth"] = depth
+            yield item_info
+            
+            # Descend into directories, without following symlinks
+            if depth + 1 < max_depth and entry.is_dir(follow_symlinks=False):
+                try:
+                    entries = self._scandir_sorted(entry.path)
+                    stack.append((iter(entries), depth + 1, rel_path))
+                except OSError:
+                    pass  # Skip directories we can't access or that vanished
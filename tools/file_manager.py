@@ -7,9 +7,60 @@ Extreme caution is advised.
 """
 
 import os
+import errno
 import shutil
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Mapping, Any, Optional
+
+from tools._spec import freeze_spec
+
+
+_TOOL_SPEC = freeze_spec({
+    "tool_name": "FILE_MANAGER",
+    "description": "A tool for creating, moving, and deleting files and directories. All methods are destructive.",
+    "methods": [
+        {
+            "name": "create_file",
+            "description": "Creates a new file, with optional content.",
+            "parameters": {
+                "file_path": {"type": "string", "description": "The path for the new file.", "required": True},
+                "content": {"type": "string", "description": "Optional content for the file.", "required": False, "default": ""}
+            },
+            "returns": "A confirmation message.",
+            "destruct_flag": True
+        },
+        {
+            "name": "create_directory",
+            "description": "Creates a new directory.",
+            "parameters": {
+                "dir_path": {"type": "string", "description": "The path for the new directory.", "required": True}
+            },
+            "returns": "A confirmation message.",
+            "destruct_flag": True
+        },
+        {
+            "name": "move",
+            "description": "Moves a file or directory from a source to a destination.",
+            "parameters": {
+                "source_path": {"type": "string", "description": "The path of the file/directory to move.", "required": True},
+                "destination_path": {"type": "string", "description": "The destination path.", "required": True}
+            },
+            "returns": "A confirmation message.",
+            "destruct_flag": True
+        },
+        {
+            "name": "delete",
+            "description": "Deletes a file or directory. Highly destructive.",
+            "parameters": {
+                "path": {"type": "string", "description": "The path of the file or directory to delete.", "required": True},
+                "recursive": {"type": "boolean", "description": "If True, allows recursive deletion of non-empty directories.", "required": False, "default": False}
+            },
+            "returns": "A confirmation message.",
+            "destruct_flag": True
+        }
+    ]
+})
+
 
 class FileManagerTool:
     """
@@ -27,6 +78,8 @@ class FileManagerTool:
             base_path: Optional base path to restrict access (default: current directory)
         """
         self.base_path = Path(base_path) if base_path else Path.cwd()
+        self._base_resolved = os.path.realpath(self.base_path)
+        self._base_prefix = os.path.join(self._base_resolved, '')
         self.tool_name = "FILE_MANAGER"
         
     def create_file(self, file_path: str, content: str = "") -> Dict[str, Any]:
@@ -46,14 +99,22 @@ class FileManagerTool:
             if not self._is_safe_path(target_path):
                 return {"success": False, "error": "Access denied"}
 
-            if target_path.exists():
-                return {"success": False, "error": f"File already exists: {file_path}"}
-            
             # Create parent directories if they don't exist
-            target_path.parent.mkdir(parents=True, exist_ok=True)
+            if not os.path.isdir(target_path.parent):
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # O_EXCL makes the existence check and the creation one atomic step
+            try:
+                fd = os.open(target_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            except FileExistsError:
+                return {"success": False, "error": f"File already exists: {file_path}"}
 
-            with open(target_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            try:
+                data = memoryview(content.encode('utf-8'))
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
                 
             return {"success": True, "message": f"File created: {file_path}"}
         except Exception as e:
@@ -104,6 +165,16 @@ class FileManagerTool:
             if not source.exists():
                 return {"success": False, "error": f"Source path not found: {source_path}"}
 
+            # A plain rename covers moves within one filesystem; shutil.move is
+            # only needed to move into a directory or across filesystems
+            if not os.path.isdir(destination):
+                try:
+                    os.replace(source, destination)
+                    return {"success": True, "message": f"Moved {source_path} to {destination_path}"}
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+
             shutil.move(str(source), str(destination))
             return {"success": True, "message": f"Moved {source_path} to {destination_path}"}
         except Exception as e:
@@ -144,58 +215,11 @@ class FileManagerTool:
         except Exception as e:
             return {"success": False, "error": f"Error deleting: {str(e)}"}
 
-    def get_tool_spec(self) -> Dict[str, Any]:
+    def get_tool_spec(self) -> Mapping[str, Any]:
         """Get the tool specification for AI agent integration."""
-        return {
-            "tool_name": self.tool_name,
-            "description": "A tool for creating, moving, and deleting files and directories. All methods are destructive.",
-            "methods": [
-                {
-                    "name": "create_file",
-                    "description": "Creates a new file, with optional content.",
-                    "parameters": {
-                        "file_path": {"type": "string", "description": "The path for the new file.", "required": True},
-                        "content": {"type": "string", "description": "Optional content for the file.", "required": False, "default": ""}
-                    },
-                    "returns": "A confirmation message.",
-                    "destruct_flag": True
-                },
-                {
-                    "name": "create_directory",
-                    "description": "Creates a new directory.",
-                    "parameters": {
-                        "dir_path": {"type": "string", "description": "The path for the new directory.", "required": True}
-                    },
-                    "returns": "A confirmation message.",
-                    "destruct_flag": True
-                },
-                {
-                    "name": "move",
-                    "description": "Moves a file or directory from a source to a destination.",
-                    "parameters": {
-                        "source_path": {"type": "string", "description": "The path of the file/directory to move.", "required": True},
-                        "destination_path": {"type": "string", "description": "The destination path.", "required": True}
-                    },
-                    "returns": "A confirmation message.",
-                    "destruct_flag": True
-                },
-                {
-                    "name": "delete",
-                    "description": "Deletes a file or directory. Highly destructive.",
-                    "parameters": {
-                        "path": {"type": "string", "description": "The path of the file or directory to delete.", "required": True},
-                        "recursive": {"type": "boolean", "description": "If True, allows recursive deletion of non-empty directories.", "required": False, "default": False}
-                    },
-                    "returns": "A confirmation message.",
-                    "destruct_flag": True
-                }
-            ]
-        }
+        return _TOOL_SPEC
 
     def _is_safe_path(self, path: Path) -> bool:
         """Check if path is within allowed directory."""
-        try:
-            path.resolve().relative_to(self.base_path.resolve())
-            return True
-        except ValueError:
-            return False
+        resolved = os.path.realpath(path)
+        return resolved == self._base_resolved or resolved.startswith(self._base_prefix)
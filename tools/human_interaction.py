@@ -5,15 +5,51 @@ This tool allows the AI agent to explicitly ask the user for information
 or a decision, and wait for their response.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Mapping, Any, Optional, List
 from rich.prompt import Prompt, IntPrompt
 from rich.console import Console
-from rich.panel import Panel
 from rich.table import Table
 from rich import box
 
+from tools._spec import freeze_spec
+
 console = Console()
 
+# The numbered-choice prompt never changes, so one instance is reused for
+# every question (and every retry after invalid input)
+choice_prompt = IntPrompt("[cyan]Enter your choice (number)[/cyan]", console=console)
+
+_TOOL_SPEC = freeze_spec({
+    "tool_name": "HUMAN_INTERACTION",
+    "description": "A tool to ask the human user a question and get their answer.",
+    "methods": [
+        {
+            "name": "ask_question",
+            "description": "Asks the user a question and returns their answer. Use this when you need a specific piece of information or a decision from the user before proceeding.",
+            "parameters": {
+                "question": {
+                    "type": "string",
+                    "description": "The question to be presented to the user.",
+                    "required": True
+                },
+                "choices": {
+                    "type": "array",
+                    "description": "An optional list of allowed answers. If provided, the user will be forced to choose one.",
+                    "required": False
+                },
+                "default": {
+                    "type": "string",
+                    "description": "An optional default answer to use if the user provides no input.",
+                    "required": False
+                }
+            },
+            "returns": "A dictionary containing the user's answer under the 'answer' key.",
+            "destruct_flag": False
+        }
+    ]
+})
+
+
 class HumanInteractionTool:
     """
     A tool for the AI agent to interact with the human user.
@@ -25,6 +61,26 @@ class HumanInteractionTool:
         """
         self.tool_name = "HUMAN_INTERACTION"
 
+        # Styling shared by every choice table; see _new_choice_table()
+        self._table_kwargs = dict(
+            box=box.ROUNDED,
+            border_style="cyan",
+            show_header=False,
+            padding=(0, 1)
+        )
+
+    def _new_choice_table(self) -> Table:
+        """
+        Create an empty, styled table for listing numbered choices.
+
+        A rich Table keeps its rows, so a fresh one is needed per question;
+        only the styling and column setup are shared.
+        """
+        table = Table(**self._table_kwargs)
+        table.add_column("Number", style="cyan", width=6, justify="right")
+        table.add_column("Option", style="white")
+        return table
+
     def ask_question(
         self,
         question: str,
@@ -47,28 +103,22 @@ class HumanInteractionTool:
                 # Display numbered options with a table
                 console.print(f"\n[bold yellow]Question from the agent:[/bold yellow] {question}\n")
 
-                table = Table(
-                    box=box.ROUNDED,
-                    border_style="cyan",
-                    show_header=False,
-                    padding=(0, 1)
-                )
-                table.add_column("Number", style="cyan", width=6, justify="right")
-                table.add_column("Option", style="white")
-
+                table = self._new_choice_table()
                 for idx, choice in enumerate(choices, 1):
                     table.add_row(f"{idx}.", choice)
 
                 console.print(table)
                 console.print()
 
-                # Get user's numeric choice
+                # Get user's numeric choice; the default is looked up once,
+                # in a single scan, not on every retry
+                try:
+                    default_num = choices.index(default) + 1
+                except ValueError:
+                    default_num = 1
                 while True:
                     try:
-                        choice_num = IntPrompt.ask(
-                            "[cyan]Enter your choice (number)[/cyan]",
-                            default=1 if default is None else choices.index(default) + 1 if default in choices else 1
-                        )
+                        choice_num = choice_prompt(default=default_num)
 
                         if 1 <= choice_num <= len(choices):
                             answer = choices[choice_num - 1]
@@ -95,36 +145,8 @@ class HumanInteractionTool:
                 "error": f"An error occurred while asking the user: {str(e)}"
             }
 
-    def get_tool_spec(self) -> Dict[str, Any]:
+    def get_tool_spec(self) -> Mapping[str, Any]:
         """
         Get the tool specification for AI agent integration.
         """
-        return {
-            "tool_name": self.tool_name,
-            "description": "A tool to ask the human user a question and get their answer.",
-            "methods": [
-                {
-                    "name": "ask_question",
-                    "description": "Asks the user a question and returns their answer. Use this when you need a specific piece of information or a decision from the user before proceeding.",
-                    "parameters": {
-                        "question": {
-                            "type": "string",
-                            "description": "The question to be presented to the user.",
-                            "required": True
-                        },
-                        "choices": {
-                            "type": "array",
-                            "description": "An optional list of allowed answers. If provided, the user will be forced to choose one.",
-                            "required": False
-                        },
-                        "default": {
-                            "type": "string",
-                            "description": "An optional default answer to use if the user provides no input.",
-                            "required": False
-                        }
-                    },
-                    "returns": "A dictionary containing the user's answer under the 'answer' key.",
-                    "destruct_flag": False
-                }
-            ]
-        }
+        return _TOOL_SPEC
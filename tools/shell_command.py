@@ -6,9 +6,123 @@ This is an extremely powerful and DANGEROUS tool. It should be used
 with maximum caution and user supervision.
 """
 
+import errno
+import os
+import re
+import shutil
 import subprocess
 import shlex
-from typing import Dict, Any
+import uuid
+import threading
+import time
+from collections import deque
+from typing import Dict, Mapping, Any, List, Optional, Tuple
+
+from tools._spec import freeze_spec
+
+# Default number of bytes kept of each output stream
+DEFAULT_OUTPUT_LIMIT = 1024 * 1024
+
+# Maximum number of bytes read from a pipe at a time
+READ_CHUNK_SIZE = 64 * 1024
+
+# Characters and words that need a shell to interpret them: operators,
+# redirection, expansion, globbing, quoting escapes, comments, newlines
+# and leading variable assignments
+_NEEDS_SHELL = re.compile(r'[|&;<>$`\\*?(){}\[\]~#!\n]|^\s*\w+=')
+
+# Shell builtins and keywords, which have no executable of their own (or
+# one that cannot affect the shell's state)
+_SHELL_WORDS = frozenset({
+    ".", ":", "alias", "bg", "break", "case", "cd", "command", "continue",
+    "eval", "exec", "exit", "export", "fg", "for", "getopts", "hash", "if",
+    "jobs", "read", "readonly", "return", "set", "shift", "source", "times",
+    "trap", "type", "ulimit", "umask", "unalias", "unset", "until", "wait",
+    "while"
+})
+
+class _TailBuffer:
+    """Keeps the last `limit` bytes written to it."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.chunks = deque()
+        self.size = 0
+        self.dropped = 0
+
+    def drain(self, pipe) -> None:
+        """Read a pipe until EOF, keeping only the tail of its data."""
+        with pipe:
+            for chunk in iter(lambda: pipe.read1(READ_CHUNK_SIZE), b""):
+                self.chunks.append(chunk)
+                self.size += len(chunk)
+                # Drop whole chunks from the front while the rest still fills the limit
+                while self.size - len(self.chunks[0]) >= self.limit:
+                    self.size -= len(self.chunks[0])
+                    self.dropped += len(self.chunks.popleft())
+
+    def text(self) -> str:
+        """Return the kept data as text, noting how much was dropped."""
+        data = b"".join(self.chunks)
+        excess = max(0, len(data) - self.limit)
+        text = data[excess:].decode("utf-8", errors="replace")
+        dropped = self.dropped + excess
+        if dropped:
+            text = f"[... {dropped} bytes of earlier output truncated ...]\n" + text
+        return text
+
+
+_TOOL_SPEC = freeze_spec({
+    "tool_name": "SHELL_COMMAND",
+    "description": "Executes arbitrary shell commands. DANGEROUS: This tool can modify files, access the internet, and cause unintended side effects. All commands should be reviewed carefully.",
+    "methods": [
+        {
+            "name": "execute",
+            "description": "Executes a single shell command and returns its output.",
+            "parameters": {
+                "command": {
+                    "type": "string",
+                    "description": "The shell command to execute (e.g., 'ls -l', 'pip install <package>').",
+                    "required": True
+                },
+                "timeout": {
+                    "type": "integer",
+                    "description": "The maximum number of seconds to allow the command to run.",
+                    "required": False,
+                    "default": 60
+                }
+            },
+            "returns": "A dictionary containing the command's stdout, stderr, and return code.",
+            "destruct_flag": True  # <-- Always destructive
+        },
+        {
+            "name": "execute_batch",
+            "description": "Executes several shell commands in order in one shell session (the working directory and variables carry over) and returns the output of each.",
+            "parameters": {
+                "commands": {
+                    "type": "array",
+                    "description": "The shell commands to execute, in order.",
+                    "required": True
+                },
+                "stop_on_error": {
+                    "type": "boolean",
+                    "description": "Stop at the first command that fails (non-zero exit code).",
+                    "required": False,
+                    "default": True
+                },
+                "timeout": {
+                    "type": "integer",
+                    "description": "The maximum number of seconds to allow the whole batch to run.",
+                    "required": False,
+                    "default": 60
+                }
+            },
+            "returns": "A dictionary with a list of results (stdout, stderr and return code per command that ran) and the number of skipped commands.",
+            "destruct_flag": True
+        }
+    ]
+})
+
 
 class ShellCommandTool:
     """
@@ -20,11 +134,16 @@ class ShellCommandTool:
     carefully reviewed by the user.
     """
     
-    def __init__(self):
+    def __init__(self, output_limit: int = DEFAULT_OUTPUT_LIMIT):
         """
         Initialize the Shell Command tool.
+
+        Args:
+            output_limit: Maximum number of bytes kept of each of stdout and
+                          stderr; only the last output_limit bytes are returned.
         """
         self.tool_name = "SHELL_COMMAND"
+        self.output_limit = output_limit
 
     def execute(self, command: str, timeout: int = 60) -> Dict[str, Any]:
         """
@@ -42,16 +161,21 @@ class ShellCommandTool:
             # to avoid shell injection if shell=False. However, for a "general"
             # shell tool, features like pipes (|) and redirection (>) are
             # often expected, which requires shell=True.
-            # We will proceed with shell=True but acknowledge the risk.
+            # Simple commands that need none of that are run directly, which
+            # also saves starting /bin/sh; everything else goes through the shell.
+            args = self._split_simple_command(command)
             
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                encoding='utf-8'
-            )
+            if args is None:
+                result = self._run(command, True, timeout)
+            else:
+                try:
+                    result = self._run(args, False, timeout)
+                except OSError as e:
+                    # A script without a #! line can't be exec'ed directly,
+                    # but the shell runs it as a shell script
+                    if e.errno != errno.ENOEXEC:
+                        raise
+                    result = self._run(command, True, timeout)
             
             return {
                 "success": True,
@@ -76,32 +200,184 @@ class ShellCommandTool:
                 "returncode": -1
             }
 
-    def get_tool_spec(self) -> Dict[str, Any]:
+    def _run(self, args, shell: bool, timeout: int) -> subprocess.CompletedProcess:
         """
-        Get the tool specification for AI agent integration.
+        Run a command, keeping only the tail of its output.
+
+        stdout and stderr are drained by two threads into bounded buffers, so
+        a very verbose command cannot exhaust memory; at most output_limit
+        bytes of each stream are kept. Output is decoded as UTF-8, with
+        undecodable bytes replaced.
+
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish in time
+                                       (it is killed first)
+        """
+        process = subprocess.Popen(args, shell=shell, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        stdout, stderr = _TailBuffer(self.output_limit), _TailBuffer(self.output_limit)
+        drains = [
+            threading.Thread(target=stdout.drain, args=(process.stdout,), daemon=True),
+            threading.Thread(target=stderr.drain, args=(process.stderr,), daemon=True)
+        ]
+        for drain in drains:
+            drain.start()
+
+        # One deadline covers both the process and the pipes: background
+        # children (e.g. "server &") inherit the pipes and can keep them open
+        # long after the command itself has exited
+        deadline = time.monotonic() + timeout
+        try:
+            returncode = process.wait(timeout=timeout)
+            for drain in drains:
+                drain.join(timeout=max(0, deadline - time.monotonic()))
+                if drain.is_alive():
+                    raise subprocess.TimeoutExpired(args, timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            # Don't wait for the pipes again; the drain threads are daemons
+            # and finish whenever the last writer closes its end
+            raise
+
+        return subprocess.CompletedProcess(args, returncode, stdout.text(), stderr.text())
+
+    def _split_output(self, text: str, marker) -> Tuple[Dict[int, Tuple[str, Optional[str]]], str]:
+        """
+        Split batch output on its command markers.
+
+        Returns:
+            A mapping of command index to (output, return code or None), and
+            any output after the last marker
         """
+        parts = {}
+        position = 0
+        for match in marker.finditer(text):
+            parts[int(match.group(1))] = (text[position:match.start()], match.group(2))
+            position = match.end()
+        return parts, text[position:]
+
+    def _split_simple_command(self, command: str) -> Optional[List[str]]:
+        """
+        Split a command that can run without a shell into its arguments.
+
+        Returns:
+            The argument list, or None if the command needs the shell (it uses
+            shell syntax, is a builtin, or its program cannot be found).
+        """
+        if os.name != "posix" or _NEEDS_SHELL.search(command):
+            return None
+        try:
+            args = shlex.split(command)
+        except ValueError:
+            return None  # Unbalanced quotes; let the shell report the error
+        if not args or args[0] in _SHELL_WORDS or shutil.which(args[0]) is None:
+            return None
+        return args
+
+    def execute_batch(self, commands: List[str], stop_on_error: bool = True,
+                      timeout: int = 60) -> Dict[str, Any]:
+        """
+        Executes several shell commands in a single shell process.
+
+        The commands run one after another in the same shell, so state such
+        as the working directory carries over from one command to the next,
+        and only one shell has to be started for the whole batch.
+
+        Args:
+            commands: The command strings to execute, in order.
+            stop_on_error: If True, stop at the first command that exits non-zero.
+            timeout: The timeout in seconds for the whole batch.
+
+        Returns:
+            A dictionary with the stdout, stderr and return code of each
+            command that ran, and the number of commands skipped.
+        """
+        # A plain string would otherwise be run one character at a time
+        if not isinstance(commands, (list, tuple)) or not all(isinstance(command, str) for command in commands):
+            return {
+                "success": False,
+                "error": "'commands' must be a list of command strings."
+            }
+
+        if os.name == "nt":
+            # The batch script is POSIX sh; run the commands one by one instead
+            results = []
+            for command in commands:
+                result = self.execute(command, timeout=timeout)
+                results.append({"command": command, **result})
+                if stop_on_error and result["returncode"] != 0:
+                    break
+            return {
+                "success": all(result["success"] for result in results),
+                "results": results,
+                "skipped": len(commands) - len(results)
+            }
+
+        # Each command is followed by markers on stdout and stderr that
+        # separate its output from the next command's and record its exit code
+        token = f"__VIPER_SEP_{uuid.uuid4().hex}__"
+        script = []
+        for index, command in enumerate(commands):
+            script.append(command)
+            script.append(
+                f"__viper_rc=$?; printf '\\n{token}:{index}:%d\\n' \"$__viper_rc\"; "
+                f"printf '\\n{token}:{index}\\n' >&2"
+            )
+            if stop_on_error:
+                script.append('[ "$__viper_rc" -eq 0 ] || exit "$__viper_rc"')
+
+        try:
+            result = self._run("\n".join(script), True, timeout)
+        except subprocess.TimeoutExpired:
+            return {
+                "success": False,
+                "error": "Command batch timed out.",
+                "results": [],
+                "skipped": len(commands)
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"An unexpected error occurred: {str(e)}",
+                "results": [],
+                "skipped": len(commands)
+            }
+
+        marker = re.compile("\n" + token + r":(\d+)(?::(\d+))?\n")
+        stdout_parts, stdout_rest = self._split_output(result.stdout, marker)
+        stderr_parts, stderr_rest = self._split_output(result.stderr, marker)
+
+        # Markers of early commands may have been cut off with the head of
+        # long output; their output is then empty and their return code unknown
+        ran = max(stdout_parts, default=-1) + 1
+        results = []
+        for index in range(ran):
+            stdout, returncode = stdout_parts.get(index, ("", None))
+            results.append({
+                "command": commands[index],
+                "stdout": stdout,
+                "stderr": stderr_parts.get(index, ("", None))[0],
+                "returncode": None if returncode is None else int(returncode)
+            })
+
+        # A command that exits the shell itself (e.g. "exit 3") emits no marker
+        stopped = stop_on_error and results and results[-1]["returncode"] != 0
+        if len(results) < len(commands) and not stopped:
+            results.append({
+                "command": commands[len(results)],
+                "stdout": stdout_rest,
+                "stderr": stderr_rest,
+                "returncode": result.returncode
+            })
+
         return {
-            "tool_name": self.tool_name,
-            "description": "Executes arbitrary shell commands. DANGEROUS: This tool can modify files, access the internet, and cause unintended side effects. All commands should be reviewed carefully.",
-            "methods": [
-                {
-                    "name": "execute",
-                    "description": "Executes a single shell command and returns its output.",
-                    "parameters": {
-                        "command": {
-                            "type": "string",
-                            "description": "The shell command to execute (e.g., 'ls -l', 'pip install <package>').",
-                            "required": True
-                        },
-                        "timeout": {
-                            "type": "integer",
-                            "description": "The maximum number of seconds to allow the command to run.",
-                            "required": False,
-                            "default": 60
-                        }
-                    },
-                    "returns": "A dictionary containing the command's stdout, stderr, and return code.",
-                    "destruct_flag": True  # <-- Always destructive
-                }
-            ]
+            "success": True,
+            "results": results,
+            "skipped": len(commands) - len(results)
         }
+
+    def get_tool_spec(self) -> Mapping[str, Any]:
+        """
+        Get the tool specification for AI agent integration.
+        """
+        return _TOOL_SPEC
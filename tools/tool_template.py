@@ -11,7 +11,9 @@ A tool should be a self-contained class that:
 - Provides a `get_tool_spec()` method to describe its capabilities.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Mapping, Any, Optional
+
+from tools._spec import freeze_spec
 
 # --- Tool Class Definition ---
 # Each tool is a class that encapsulates its logic and state.
@@ -119,7 +121,7 @@ class MyTool:
     # --- Tool Specification ---
     # The `get_tool_spec` method is CRITICAL for AI integration.
     
-    def get_tool_spec(self) -> Dict[str, Any]:
+    def get_tool_spec(self) -> Mapping[str, Any]:
         """
         Returns the tool's specification in a structured dictionary format.
         
@@ -129,52 +131,62 @@ class MyTool:
         - Whether a method is destructive.
         
         Returns:
-            A dictionary containing the complete tool specification.
+            A read-only mapping containing the complete tool specification
+            (the module-level `_TOOL_SPEC` below).
         """
-        return {
-            "tool_name": self.tool_name,
-            "description": "A brief, clear description of what this tool does overall.",
-            "version": "1.0.0",  # Optional: for version tracking
-            "methods": [
-                {
-                    "name": "perform_action_one",
-                    "description": "A clear, one-sentence description of what this specific method does.",
-                    "parameters": {
-                        "a_string": {
-                            "type": "string",
-                            "description": "Description of what this string parameter represents.",
-                            "required": True
-                        },
-                        "a_number": {
-                            "type": "integer",
-                            "description": "Description of what this number is for.",
-                            "required": True
-                        }
-                    },
-                    "returns": "A dictionary containing the processed data.",
-                    "destruct_flag": False  # <-- Set to False for read-only actions
+        return _TOOL_SPEC
+
+
+# --- Specification Data ---
+# The specification is CRITICAL for AI integration. It never changes, so it
+# is built once at import time; freeze_spec makes it read-only so that the
+# single shared copy cannot be modified by a caller. "tool_name" must match
+# the tool's `self.tool_name`.
+
+_TOOL_SPEC = freeze_spec({
+    "tool_name": "MY_TOOL",
+    "description": "A brief, clear description of what this tool does overall.",
+    "version": "1.0.0",  # Optional: for version tracking
+    "methods": [
+        {
+            "name": "perform_action_one",
+            "description": "A clear, one-sentence description of what this specific method does.",
+            "parameters": {
+                "a_string": {
+                    "type": "string",
+                    "description": "Description of what this string parameter represents.",
+                    "required": True
+                },
+                "a_number": {
+                    "type": "integer",
+                    "description": "Description of what this number is for.",
+                    "required": True
+                }
+            },
+            "returns": "A dictionary containing the processed data.",
+            "destruct_flag": False  # <-- Set to False for read-only actions
+        },
+        {
+            "name": "perform_destructive_action",
+            "description": "Performs a destructive action, like deleting an item.",
+            "parameters": {
+                "target_id": {
+                    "type": "string",
+                    "description": "The unique identifier of the item to be deleted.",
+                    "required": True
                 },
-                {
-                    "name": "perform_destructive_action",
-                    "description": "Performs a destructive action, like deleting an item.",
-                    "parameters": {
-                        "target_id": {
-                            "type": "string",
-                            "description": "The unique identifier of the item to be deleted.",
-                            "required": True
-                        },
-                        "force": {
-                            "type": "boolean",
-                            "description": "Must be set to true to confirm the destructive operation.",
-                            "required": False,
-                            "default": False
-                        }
-                    },
-                    "returns": "A confirmation message upon successful deletion.",
-                    "destruct_flag": True  # <-- IMPORTANT: Set to True for destructive actions
+                "force": {
+                    "type": "boolean",
+                    "description": "Must be set to true to confirm the destructive operation.",
+                    "required": False,
+                    "default": False
                 }
-            ]
+            },
+            "returns": "A confirmation message upon successful deletion.",
+            "destruct_flag": True  # <-- IMPORTANT: Set to True for destructive actions
         }
+    ]
+})
 
 # --- Helper Methods (Optional) ---
 # Private helper methods can be defined outside or inside the class.
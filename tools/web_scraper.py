@@ -4,9 +4,32 @@ Web Scraper Tool
 This tool allows the AI agent to fetch the text content from a given URL.
 """
 
-import requests
-from bs4 import BeautifulSoup
-from typing import Dict, Any
+from typing import Dict, Mapping, Any
+
+from tools._html import extract_text
+from tools._http import SESSION, fetch_page
+from tools._spec import freeze_spec
+
+_TOOL_SPEC = freeze_spec({
+    "tool_name": "WEB_SCRAPER",
+    "description": "Fetches the text content of a single web page. Useful for reading articles, documentation, or other web content from a known URL.",
+    "methods": [
+        {
+            "name": "scrape",
+            "description": "Returns the cleaned text content for a given URL.",
+            "parameters": {
+                "url": {
+                    "type": "string",
+                    "description": "The full URL of the web page to scrape.",
+                    "required": True
+                }
+            },
+            "returns": "A dictionary containing the URL and its text content, or an error message.",
+            "destruct_flag": False
+        }
+    ]
+})
+
 
 class WebScraperTool:
     """
@@ -18,6 +41,8 @@ class WebScraperTool:
         Initialize the Web Scraper tool.
         """
         self.tool_name = "WEB_SCRAPER"
+        # The process-wide session, so connections are shared with the other web tools
+        self.session = SESSION
 
     def scrape(self, url: str) -> Dict[str, Any]:
         """
@@ -30,22 +55,11 @@ class WebScraperTool:
             A dictionary containing the URL and its text content, or an error.
         """
         try:
-            # Fetch the content of the URL
-            response = requests.get(url, timeout=15)
-            response.raise_for_status()  # Raise an exception for bad status codes
-            
-            # Parse the HTML and extract text
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Fetch the content of the URL (raises for bad status codes and non-HTML content)
+            html, content_type = fetch_page(self.session, url, timeout=15)
             
-            # Remove script and style elements
-            for script_or_style in soup(["script", "style"]):
-                script_or_style.decompose()
-                
-            # Get text and clean it up
-            text = soup.get_text()
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = '\n'.join(chunk for chunk in chunks if chunk)
+            # Parse the HTML and extract the visible text
+            text = extract_text(html, content_type=content_type)
             
             return {
                 "success": True,
@@ -59,26 +73,8 @@ class WebScraperTool:
                 "error": f"Failed to scrape content: {str(e)}"
             }
 
-    def get_tool_spec(self) -> Dict[str, Any]:
+    def get_tool_spec(self) -> Mapping[str, Any]:
         """
         Get the tool specification for AI agent integration.
         """
-        return {
-            "tool_name": self.tool_name,
-            "description": "Fetches the text content of a single web page. Useful for reading articles, documentation, or other web content from a known URL.",
-            "methods": [
-                {
-                    "name": "scrape",
-                    "description": "Returns the cleaned text content for a given URL.",
-                    "parameters": {
-                        "url": {
-                            "type": "string",
-                            "description": "The full URL of the web page to scrape.",
-                            "required": True
-                        }
-                    },
-                    "returns": "A dictionary containing the URL and its text content, or an error message.",
-                    "destruct_flag": False
-                }
-            ]
-        }
+        return _TOOL_SPEC
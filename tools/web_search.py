@@ -5,10 +5,43 @@ This tool allows the AI agent to perform web searches using the official
 Google Custom Search JSON API and scrape the content from the top search results.
 """
 
-import requests
-from bs4 import BeautifulSoup
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Mapping, Any, List
 from modules.config import GOOGLE_SEARCH_CONFIG
+from tools._html import extract_text
+from tools._http import SESSION, fetch_page
+from tools._spec import freeze_spec
+
+# The Custom Search API returns at most this many results per request,
+# which also bounds the number of pages fetched concurrently
+MAX_RESULTS = 10
+
+_TOOL_SPEC = freeze_spec({
+    "tool_name": "WEB_SEARCH",
+    "description": "Performs a web search using the Google Custom Search API and scrapes content from the top results. Useful for finding up-to-date information or learning about a new topic.",
+    "methods": [
+        {
+            "name": "search_and_fetch_content",
+            "description": "Searches a query on Google and returns the text content of the top search results.",
+            "parameters": {
+                "query": {
+                    "type": "string",
+                    "description": "The search query to look up.",
+                    "required": True
+                },
+                "num_results": {
+                    "type": "integer",
+                    "description": "The number of top search results to fetch content from (max 10).",
+                    "required": False,
+                    "default": 3
+                }
+            },
+            "returns": "A dictionary containing a list of results. Each result includes the source URL and the scraped text content (or an error message).",
+            "destruct_flag": False
+        }
+    ]
+})
+
 
 class WebSearchTool:
     """
@@ -24,6 +57,8 @@ class WebSearchTool:
         self.api_key = GOOGLE_SEARCH_CONFIG.get("api_key")
         self.search_engine_id = GOOGLE_SEARCH_CONFIG.get("search_engine_id")
         self.api_endpoint = "https://www.googleapis.com/customsearch/v1"
+        # The process-wide session, so connections are shared with the other web tools
+        self.session = SESSION
 
     def search_and_fetch_content(self, query: str, num_results: int = 3) -> Dict[str, Any]:
         """
@@ -49,9 +84,9 @@ class WebSearchTool:
                 'key': self.api_key,
                 'cx': self.search_engine_id,
                 'q': query,
-                'num': num_results
+                'num': min(num_results, MAX_RESULTS)
             }
-            response = requests.get(self.api_endpoint, params=params)
+            response = self.session.get(self.api_endpoint, params=params)
             response.raise_for_status()
             search_data = response.json()
             
@@ -63,31 +98,9 @@ class WebSearchTool:
                     "error": "No search results found."
                 }
             
-            # --- Scrape content from the URLs ---
-            scraped_content = []
-            for url in search_results_urls:
-                try:
-                    scrape_response = requests.get(url, timeout=10)
-                    scrape_response.raise_for_status()
-                    
-                    soup = BeautifulSoup(scrape_response.content, 'html.parser')
-                    for script_or_style in soup(["script", "style"]):
-                        script_or_style.decompose()
-                        
-                    text = soup.get_text()
-                    lines = (line.strip() for line in text.splitlines())
-                    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                    text = '\n'.join(chunk for chunk in chunks if chunk)
-                    
-                    scraped_content.append({
-                        "url": url,
-                        "content": text[:5000]
-                    })
-                except Exception as e:
-                    scraped_content.append({
-                        "url": url,
-                        "error": f"Failed to scrape content: {str(e)}"
-                    })
+            # --- Scrape content from the URLs concurrently, keeping result order ---
+            with ThreadPoolExecutor(max_workers=len(search_results_urls)) as executor:
+                scraped_content = list(executor.map(self._fetch_and_clean, search_results_urls))
             
             return {
                 "success": True,
@@ -100,32 +113,31 @@ class WebSearchTool:
                 "error": f"An unexpected error occurred during the search: {str(e)}"
             }
 
-    def get_tool_spec(self) -> Dict[str, Any]:
+    def _fetch_and_clean(self, url: str) -> Dict[str, Any]:
+        """
+        Fetch one search result and extract its text content.
+
+        Args:
+            url: The URL of the search result.
+
+        Returns:
+            A dictionary with the URL and its (truncated) text content, or an error.
+        """
+        try:
+            html, content_type = fetch_page(self.session, url, timeout=10)
+            
+            return {
+                "url": url,
+                "content": extract_text(html, max_chars=5000, content_type=content_type)
+            }
+        except Exception as e:
+            return {
+                "url": url,
+                "error": f"Failed to scrape content: {str(e)}"
+            }
+
+    def get_tool_spec(self) -> Mapping[str, Any]:
         """
         Get the tool specification for AI agent integration.
         """
-        return {
-            "tool_name": self.tool_name,
-            "description": "Performs a web search using the Google Custom Search API and scrapes content from the top results. Useful for finding up-to-date information or learning about a new topic.",
-            "methods": [
-                {
-                    "name": "search_and_fetch_content",
-                    "description": "Searches a query on Google and returns the text content of the top search results.",
-                    "parameters": {
-                        "query": {
-                            "type": "string",
-                            "description": "The search query to look up.",
-                            "required": True
-                        },
-                        "num_results": {
-                            "type": "integer",
-                            "description": "The number of top search results to fetch content from (max 10).",
-                            "required": False,
-                            "default": 3
-                        }
-                    },
-                    "returns": "A dictionary containing a list of results. Each result includes the source URL and the scraped text content (or an error message).",
-                    "destruct_flag": False
-                }
-            ]
-        }
\ No newline at end of file
+        return _TOOL_SPEC
\ No newline at end of file
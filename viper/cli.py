@@ -5,6 +5,8 @@ This module provides the command-line interface for VIPER.
 It handles argument parsing and sets up the working directory before launching the main application.
 """
 
+# Only lightweight standard library modules are imported at module level;
+# the application itself is imported once the arguments have been parsed
 import argparse
 import os
 import sys
@@ -48,25 +50,29 @@ Examples:
 
     # Determine working directory
     if args.directory:
-        working_dir = Path(args.directory).resolve()
-
-        # Validate directory exists
-        if not working_dir.exists():
+        # Change to the specified directory; chdir itself validates the
+        # path, so no separate existence or type checks are needed
+        try:
+            working_dir = Path(args.directory).resolve(strict=True)
+            os.chdir(working_dir)
+        except FileNotFoundError:
             print(f"Error: Directory does not exist: {args.directory}", file=sys.stderr)
             sys.exit(1)
-
-        if not working_dir.is_dir():
+        except NotADirectoryError:
             print(f"Error: Path is not a directory: {args.directory}", file=sys.stderr)
             sys.exit(1)
 
-        # Change to the specified directory
-        os.chdir(working_dir)
         print(f"Working directory: {working_dir}\n")
     else:
         working_dir = Path.cwd()
 
+    # stdout is left as configured by the interpreter: it is already block
+    # buffered when not attached to a terminal, and line buffered otherwise.
+
     # Import and run the main application
-    # The main.py file should be in the parent directory of this package
+    # The main.py file should be in the parent directory of this package.
+    # Keep this import here, after parse_args(): --help and --version exit
+    # during parsing and must not pay for importing the whole application.
     try:
         # Add the parent directory to sys.path to import main
         viper_root = Path(__file__).parent.parent